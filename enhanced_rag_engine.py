@@ -5,9 +5,11 @@ Fixes AsyncIO cancellation errors and implements proper LLM fallback system
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import shelve
 import time
 from datetime import datetime
 from pathlib import Path
@@ -39,6 +41,7 @@ class RAGConfig:
     vector_dim: int = 384
     max_context_length: int = 4000
     rate_limit_per_minute: int = 20
+    embedding_cache_path: str = "embeddings_cache/query_embeddings"
 
 class RateLimiter:
     """Async rate limiter for API calls"""
@@ -75,6 +78,10 @@ class EnhancedRAGEngine:
         self.documents = []
         self.argo_metadata = {}
         
+        # Disk-backed query embedding cache (content-hash keyed)
+        self.embedding_cache = None
+        self.embedding_cache_lock = threading.Lock()
+        
         # Rate limiters for different APIs
         self.rate_limiters = {
             'mistral': RateLimiter(self.config.rate_limit_per_minute),
@@ -101,6 +108,9 @@ class EnhancedRAGEngine:
             }
         }
         
+        # Shared HTTP session (connection pool) for LLM API calls
+        self.http_session = None
+        
         # Active sessions and tasks
         self.active_sessions = {}
         self.session_lock = asyncio.Lock()
@@ -119,6 +129,12 @@ class EnhancedRAGEngine:
             )
             logger.info(f"Embedding model loaded, dimension: {self.config.vector_dim}")
             
+            # Open query embedding cache
+            self._open_embedding_cache()
+            
+            # Create pooled HTTP session reused across LLM calls
+            self._get_http_session()
+            
             # Load ARGO data and build vector index
             await self.load_argo_data()
             await self.build_vector_index()
@@ -394,13 +410,44 @@ class EnhancedRAGEngine:
             logger.error(f"Error building vector index: {e}")
             raise
     
+    def _open_embedding_cache(self):
+        """Open disk-backed cache for query embeddings"""
+        try:
+            cache_path = Path(self.config.embedding_cache_path)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.embedding_cache = shelve.open(str(cache_path))
+            logger.info(f"Query embedding cache opened: {cache_path}")
+        except Exception as e:
+            logger.warning(f"Query embedding cache unavailable: {e}")
+            self.embedding_cache = None
+    
+    def _encode_query(self, query: str) -> np.ndarray:
+        """Encode query text, reusing cached embeddings keyed by content hash"""
+        if self.embedding_cache is None:
+            return self.embedding_model.encode([query])
+        
+        key = hashlib.blake2b(query.encode('utf-8'), digest_size=16).hexdigest()
+        with self.embedding_cache_lock:
+            cached = self.embedding_cache.get(key)
+        
+        if cached is not None:
+            # Stored as float16 bytes - lossless enough for cosine retrieval
+            return np.frombuffer(cached, dtype=np.float16).astype('float32').reshape(1, -1)
+        
+        # Return the same float16-rounded vector a later cache hit would, so ranking
+        # does not depend on whether the query was cached
+        embedding = self.embedding_model.encode([query]).astype(np.float16)
+        with self.embedding_cache_lock:
+            self.embedding_cache[key] = embedding.tobytes()
+        return embedding.astype('float32').reshape(1, -1)
+    
     async def retrieve_relevant_documents(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
         """Retrieve relevant documents for query"""
         try:
-            # Generate query embedding
+            # Generate query embedding (cached by content hash)
             loop = asyncio.get_event_loop()
             query_embedding = await loop.run_in_executor(
-                None, self.embedding_model.encode, [query]
+                None, self._encode_query, query
             )
             
             # Search vector index
@@ -512,43 +559,42 @@ class EnhancedRAGEngine:
                 # Apply rate limiting
                 await self.rate_limiters[llm_name].acquire()
                 
-                # Create timeout context
-                timeout = aiohttp.ClientTimeout(total=self.config.request_timeout)
+                # Reuse pooled session instead of opening a new connection per call
+                session = self._get_http_session()
                 
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    headers = {
-                        'Authorization': f'Bearer {config["key"]}',
-                        'Content-Type': 'application/json'
-                    }
-                    
-                    payload = {
-                        'model': config['model'],
-                        'messages': [
-                            {
-                                'role': 'system',
-                                'content': f"You are an expert oceanographer analyzing real ARGO float data. Use this context to answer queries accurately:\n\n{context}"
-                            },
-                            {
-                                'role': 'user', 
-                                'content': query
-                            }
-                        ],
-                        'max_tokens': 2000,
-                        'temperature': 0.7
-                    }
-                    
-                    async with session.post(config['url'], json=payload, headers=headers) as response:
-                        if response.status == 200:
-                            result = await response.json()
-                            return result['choices'][0]['message']['content']
-                        elif response.status == 429:  # Rate limited
-                            wait_time = 2 ** attempt
-                            logger.warning(f"{llm_name} rate limited, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        else:
-                            error_text = await response.text()
-                            raise aiohttp.ClientError(f"HTTP {response.status}: {error_text}")
+                headers = {
+                    'Authorization': f'Bearer {config["key"]}',
+                    'Content-Type': 'application/json'
+                }
+                
+                payload = {
+                    'model': config['model'],
+                    'messages': [
+                        {
+                            'role': 'system',
+                            'content': f"You are an expert oceanographer analyzing real ARGO float data. Use this context to answer queries accurately:\n\n{context}"
+                        },
+                        {
+                            'role': 'user', 
+                            'content': query
+                        }
+                    ],
+                    'max_tokens': 2000,
+                    'temperature': 0.7
+                }
+                
+                async with session.post(config['url'], json=payload, headers=headers) as response:
+                    if response.status == 200:
+                        result = await response.json()
+                        return result['choices'][0]['message']['content']
+                    elif response.status == 429:  # Rate limited
+                        wait_time = 2 ** attempt
+                        logger.warning(f"{llm_name} rate limited, waiting {wait_time}s")
+                        await asyncio.sleep(wait_time)
+                        continue
+                    else:
+                        error_text = await response.text()
+                        raise aiohttp.ClientError(f"HTTP {response.status}: {error_text}")
             
             except asyncio.TimeoutError:
                 logger.warning(f"{llm_name} timeout on attempt {attempt + 1}")
@@ -566,6 +612,22 @@ class EnhancedRAGEngine:
         
         return None
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self.http_session is None or self.http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=self.config.request_timeout,
+                sock_connect=5,
+                sock_read=self.config.request_timeout
+            )
+            self.http_session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.http_session
+    
     def _build_context(self, relevant_docs: List[Dict[str, Any]]) -> str:
         """Build context string from relevant documents"""
         context_parts = ["RELEVANT ARGO DATA CONTEXT:"]
@@ -650,6 +712,19 @@ class EnhancedRAGEngine:
         async with self.session_lock:
             self.active_sessions.clear()
         
+        # Close pooled HTTP session
+        if self.http_session is not None and not self.http_session.closed:
+            await self.http_session.close()
+            # Allow underlying SSL transports to close cleanly
+            await asyncio.sleep(0.25)
+        self.http_session = None
+        
+        # Flush query embedding cache to disk
+        if self.embedding_cache is not None:
+            with self.embedding_cache_lock:
+                self.embedding_cache.close()
+            self.embedding_cache = None
+        
         logger.info("Enhanced RAG Engine shutdown complete")
 
 # Test function with proper async handling
@@ -692,12 +767,20 @@ async def test_enhanced_rag_engine():
                     'error': 'timeout'
                 }
         
-        # Execute queries concurrently
-        tasks = [query_with_timeout(query) for query in test_queries]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Execute queries with bounded concurrency
+        semaphore = asyncio.Semaphore(config.max_concurrent_requests)
+        
+        async def bounded_query(index: int, query: str):
+            async with semaphore:
+                try:
+                    return index, await query_with_timeout(query)
+                except Exception as e:
+                    return index, e
         
-        # Display results
-        for i, result in enumerate(results):
+        # Display results as they complete
+        tasks = [bounded_query(i, query) for i, query in enumerate(test_queries)]
+        for future in asyncio.as_completed(tasks):
+            i, result = await future
             if isinstance(result, Exception):
                 print(f"\nQuery {i+1} failed: {result}")
             else:
@@ -1,10 +1,63 @@
 import pandas as pd
 import json
+import re
 from datetime import datetime
 import numpy as np
 import netCDF4 as nc
 from pathlib import Path
 
+def _stats_kernel(values):
+    """Compute mean, min, max and std of a value list from a single array"""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    mean = arr.mean()
+    return mean, arr.min(), arr.max(), arr.std()
+
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_JULD_EPOCH = np.datetime64('1950-01-01', 'D')
+
+def _julian_days(date_strs):
+    """Convert ISO datetime strings to days since 1950-01-01 (invalid -> 0)"""
+    dates = [d[:10] if isinstance(d, str) and _ISO_DATE_RE.match(d[:10]) else '1950-01-01' for d in date_strs]
+    try:
+        parsed = np.array(dates, dtype='datetime64[D]')
+    except ValueError:
+        # Well-formed but impossible dates (e.g. month 13) - parse individually
+        parsed = np.empty(len(dates), dtype='datetime64[D]')
+        for i, d in enumerate(dates):
+            try:
+                parsed[i] = np.datetime64(d, 'D')
+            except ValueError:
+                parsed[i] = _JULD_EPOCH
+    return (parsed - _JULD_EPOCH).astype(np.int64)
+
+_SUMMARY_TEMPLATE = """
+ARGO DATA SUMMARY REPORT
+Generated: {generated}
+Query: {query}
+{rule}
+
+OVERVIEW:
+  Total Profiles: {total_profiles}
+  Regions: {regions}
+  Years Covered: {years}
+
+TEMPERATURE ANALYSIS:
+  Profiles with Temperature: {temp_count}
+  Mean Temperature: {temp_mean:.2f}°C
+  Min Temperature: {temp_min:.2f}°C
+  Max Temperature: {temp_max:.2f}°C
+  Std Deviation: {temp_std:.2f}°C
+
+SALINITY ANALYSIS:
+  Profiles with Salinity: {sal_count}
+  Mean Salinity: {sal_mean:.2f} PSU
+  Min Salinity: {sal_min:.2f} PSU
+  Max Salinity: {sal_max:.2f} PSU
+  Std Deviation: {sal_std:.2f} PSU
+"""
+
 class ARGOExporter:
     """Export ARGO data in multiple formats"""
     
@@ -12,6 +65,23 @@ class ARGOExporter:
         self.export_dir = Path("exports")
         self.export_dir.mkdir(exist_ok=True)
     
+    def export(self, profiles, query="", formats=('csv', 'json')):
+        """Export profiles only in the requested formats; ASCII is built only when asked for"""
+        writers = {
+            'ascii': self.export_to_ascii,
+            'csv': self.export_to_csv,
+            'json': self.export_to_json,
+            'netcdf': self.export_to_netcdf
+        }
+        
+        outputs = {}
+        for fmt in formats:
+            if fmt not in writers:
+                raise ValueError(f"Unsupported export format: {fmt}")
+            outputs[fmt] = writers[fmt](profiles, query)
+        
+        return outputs
+    
     def export_to_ascii(self, profiles, query="", filename=None):
         """Export profiles to ASCII format for scientific analysis"""
         if filename is None:
@@ -149,8 +219,8 @@ class ARGOExporter:
         df.to_csv(filename, index=False)
         return str(filename)
     
-    def export_to_json(self, profiles, query="", filename=None):
-        """Export profiles to JSON format for programmatic access"""
+    def export_to_json(self, profiles, query="", filename=None, pretty=False):
+        """Export profiles to JSON format for programmatic access (compact unless pretty=True)"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = self.export_dir / f"argo_export_{timestamp}.json"
@@ -166,7 +236,7 @@ class ARGOExporter:
         }
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            self._dump_json(export_data, f, pretty)
         
         return str(filename)
     
@@ -190,31 +260,31 @@ class ARGOExporter:
         dataset.query = query
         dataset.date_created = datetime.now().isoformat()
         
-        # Variables
-        juld = dataset.createVariable('JULD', 'f8', ('N_PROF',))
-        latitude = dataset.createVariable('LATITUDE', 'f4', ('N_PROF',))
-        longitude = dataset.createVariable('LONGITUDE', 'f4', ('N_PROF',))
+        # Variables - chunked along N_PROF and compressed for partial re-reads
+        dataset.set_auto_mask(False)
+        storage = {
+            'zlib': True,
+            'complevel': 4,
+            'shuffle': True,
+            'chunksizes': (max(1, min(1024, n_profiles)),)
+        }
+        juld = dataset.createVariable('JULD', 'f8', ('N_PROF',), **storage)
+        latitude = dataset.createVariable('LATITUDE', 'f4', ('N_PROF',), **storage)
+        longitude = dataset.createVariable('LONGITUDE', 'f4', ('N_PROF',), **storage)
         
-        # Fill data
-        for i, profile in enumerate(profiles):
-            temporal = profile.get('temporal', {})
-            spatial = profile.get('geospatial', {})
-            
+        # Fill data with one bulk write per variable
+        if n_profiles:
             # Convert datetime to JULD (days since 1950-01-01)
-            try:
-                dt = datetime.fromisoformat(temporal.get('datetime', '1950-01-01')[:19])
-                ref_date = datetime(1950, 1, 1)
-                juld[i] = (dt - ref_date).days
-            except:
-                juld[i] = 0
+            date_strs = [p.get('temporal', {}).get('datetime', '1950-01-01') for p in profiles]
+            juld[:] = _julian_days(date_strs)
             
-            latitude[i] = spatial.get('latitude', 0)
-            longitude[i] = spatial.get('longitude', 0)
+            latitude[:] = np.array([p.get('geospatial', {}).get('latitude', 0) for p in profiles], dtype='f4')
+            longitude[:] = np.array([p.get('geospatial', {}).get('longitude', 0) for p in profiles], dtype='f4')
         
         dataset.close()
         return str(filename)
     
-    def export_session_history(self, messages, query_stats, filename=None):
+    def export_session_history(self, messages, query_stats, filename=None, pretty=False):
         """Export chat session history"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -236,10 +306,18 @@ class ARGOExporter:
         }
         
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+            self._dump_json(session_data, f, pretty)
         
         return str(filename)
     
+    def _dump_json(self, data, f, pretty=False):
+        """Write JSON compactly (C encoder path) or indented for human reading"""
+        if pretty:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+            f.write("\n")
+    
     def create_summary_report(self, profiles, query=""):
         """Create a comprehensive summary report"""
         if not profiles:
@@ -270,32 +348,27 @@ class ARGOExporter:
                 if sal_stats.get('mean'):
                     sal_values.append(sal_stats['mean'])
         
-        summary = f"""
-ARGO DATA SUMMARY REPORT
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Query: {query}
-{'='*80}
-
-OVERVIEW:
-  Total Profiles: {len(profiles)}
-  Regions: {', '.join(sorted(regions))}
-  Years Covered: {', '.join(map(str, sorted(years)))}
-
-TEMPERATURE ANALYSIS:
-  Profiles with Temperature: {len(temp_values)}
-  Mean Temperature: {np.mean(temp_values):.2f}°C
-  Min Temperature: {np.min(temp_values):.2f}°C
-  Max Temperature: {np.max(temp_values):.2f}°C
-  Std Deviation: {np.std(temp_values):.2f}°C
-
-SALINITY ANALYSIS:
-  Profiles with Salinity: {len(sal_values)}
-  Mean Salinity: {np.mean(sal_values):.2f} PSU
-  Min Salinity: {np.min(sal_values):.2f} PSU
-  Max Salinity: {np.max(sal_values):.2f} PSU
-  Std Deviation: {np.std(sal_values):.2f} PSU
-"""
-        return summary
+        t_mean, t_min, t_max, t_std = _stats_kernel(temp_values)
+        s_mean, s_min, s_max, s_std = _stats_kernel(sal_values)
+        
+        return _SUMMARY_TEMPLATE.format_map({
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'query': query,
+            'rule': '=' * 80,
+            'total_profiles': len(profiles),
+            'regions': ', '.join(sorted(regions)),
+            'years': ', '.join(map(str, sorted(years))),
+            'temp_count': len(temp_values),
+            'temp_mean': t_mean,
+            'temp_min': t_min,
+            'temp_max': t_max,
+            'temp_std': t_std,
+            'sal_count': len(sal_values),
+            'sal_mean': s_mean,
+            'sal_min': s_min,
+            'sal_max': s_max,
+            'sal_std': s_std
+        })
 
 # Convenience functions for easy import
 def export_ascii(profiles, query=""):
@@ -314,6 +387,10 @@ def export_netcdf(profiles, query=""):
     exporter = ARGOExporter()
     return exporter.export_to_netcdf(profiles, query)
 
+def export_formats(profiles, query="", formats=('csv', 'json')):
+    exporter = ARGOExporter()
+    return exporter.export(profiles, query, formats)
+
 def export_session(messages, stats):
     exporter = ARGOExporter()
     return exporter.export_session_history(messages, stats)
@@ -10,6 +10,7 @@ Geospatial Dashboard for FloatChat - PRODUCTION READY
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
@@ -18,14 +19,53 @@ from pathlib import Path
 from datetime import datetime
 import logging
 import os
+import base64
+import io
+import mmap
+import zlib
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Streamlit fragments (1.33+) rerun independently of the rest of the page;
+# on older versions the panels simply render inline
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
 # Set proper file paths
 BASE_PATH = Path("D:/FloatChat ARGO/MINIO")
 
+# Regional boundaries as (name, (lat_min, lat_max), (lon_min, lon_max)) - first match wins
+REGION_BOUNDS = [
+    ('Bay of Bengal', (5, 22), (80, 100)),
+    ('Arabian Sea', (8, 25), (60, 80)),
+    ('Southern Indian Ocean', (-10, 5), (70, 90)),
+    ('Northern Indian Ocean', (22, 30), (60, 85))
+]
+_REGION_LIMITS = np.array([[lat[0], lat[1], lon[0], lon[1]] for _, lat, lon in REGION_BOUNDS])
+
+# Point count above which 2-D profile plots switch to WebGL (Scattergl)
+WEBGL_POINT_THRESHOLD = 500
+
+# Client-side chart options: no logo, double-click resets the view
+PLOTLY_CONFIG = {'displaylogo': False, 'doubleClick': 'reset'}
+
+# Maximum points plotted per float trajectory
+MAX_TRAJECTORY_POINTS = 200
+
+# Default per-float point budget in the 3D view (adjustable from the sidebar)
+POINT_BUDGET_PER_FLOAT = 2000
+
+# Size of the shared pool of placeholder depths for floats without depth data
+SYNTHETIC_DEPTH_POOL_SIZE = 1_000_000
+
+# Processed JSON data files
+DATA_FILES = [
+    "processed_oceanographic_data.json",
+    "argo_extracted_data.json",
+    "incois_comprehensive_data.json"
+]
+
 # Optional NetCDF import with fallback
 try:
     import netCDF4 as nc
@@ -34,30 +74,410 @@ except ImportError:
     NETCDF_AVAILABLE = False
     logger.warning("NetCDF4 not available - using JSON data only")
 
+# HDF5 chunk cache sizing for full-variable reads (default is ~1 MiB)
+CHUNK_CACHE_SIZE = 256 * 1024 * 1024
+CHUNK_CACHE_NELEMS = 2003
+CHUNK_CACHE_PREEMPTION = 0.75
+VAR_CHUNK_CACHE_SIZE = 64 * 1024 * 1024
+
+if NETCDF_AVAILABLE:
+    try:
+        nc.set_chunk_cache(CHUNK_CACHE_SIZE, CHUNK_CACHE_NELEMS, CHUNK_CACHE_PREEMPTION)
+    except Exception as e:
+        logger.warning(f"Could not set NetCDF chunk cache: {e}")
+
+# Optional fast JSON parsing: orjson for whole files, ijson for streaming huge files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Serialize figures with orjson (native float32 arrays, no Python JSON encoder)
+if ORJSON_AVAILABLE:
+    pio.json.config.default_engine = 'orjson'
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+STREAMING_JSON_THRESHOLD = 500_000_000  # bytes
+MMAP_JSON_THRESHOLD = 100_000_000  # bytes
+
+# Optional pyarrow for the Parquet cache of combined JSON data
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Parquet schema metadata key holding the JSON source names and mtimes a cache was built from
+NUMERIC_CACHE_SIGNATURE_KEY = b'source_signature'
+
+# Optional Datashader for rasterizing large point clouds
+try:
+    import datashader as dsh
+    import datashader.transfer_functions as tf
+    from datashader.utils import lnglat_to_meters
+    DATASHADER_AVAILABLE = True
+except ImportError:
+    DATASHADER_AVAILABLE = False
+
+# Point count above which the regional map and 3D view are rasterized with Datashader
+DATASHADER_THRESHOLD = 50_000
+
+# Optional numexpr for fused element-wise kernels
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Optional pydeck (shipped with Streamlit) for GPU point clouds in the 3D view
+try:
+    import pydeck as pdk
+    PYDECK_AVAILABLE = True
+except ImportError:
+    PYDECK_AVAILABLE = False
+
+# Point count above which the 3D view switches to a deck.gl point cloud, and the
+# vertical exaggeration applied to depths there
+POINT_CLOUD_THRESHOLD = 100_000
+POINT_CLOUD_DEPTH_SCALE = 50
+
+# Rasterized 3D view: grid resolution and depth band edges (m)
+RASTER_3D_RESOLUTION = 256
+RASTER_3D_DEPTH_BANDS = np.array([0, 100, 250, 500, 1000, 1500, 2000, 6000])
+
+# Optional xarray/Dask for batched multi-file NetCDF reads
+try:
+    import xarray as xr
+    XARRAY_AVAILABLE = True
+except ImportError:
+    XARRAY_AVAILABLE = False
+
+try:
+    import dask
+    DASK_AVAILABLE = True
+except ImportError:
+    DASK_AVAILABLE = False
+
+# Preferred xarray engine: hidefix (lock-free parallel HDF5 reads), then h5netcdf,
+# then xarray's default netCDF4 engine
+XARRAY_ENGINE = None
+if XARRAY_AVAILABLE:
+    try:
+        installed_engines = xr.backends.list_engines()
+    except Exception:
+        installed_engines = {}
+    for engine_name in ('hidefix', 'h5netcdf'):
+        if engine_name in installed_engines:
+            XARRAY_ENGINE = engine_name
+            break
+    if XARRAY_ENGINE == 'hidefix':
+        os.environ.setdefault('RAYON_NUM_THREADS', str(os.cpu_count() or 1))
+
+def _coordinate_array(coordinates):
+    """Convert [lat, lon] pairs to an (N, 2) float array; malformed pairs become NaN"""
+    try:
+        arr = np.asarray(coordinates, dtype=np.float64)
+        if arr.ndim == 2 and arr.shape[1] == 2:
+            return arr
+    except (ValueError, TypeError):
+        pass
+    
+    return np.array(
+        [coord if len(coord) == 2 else (np.nan, np.nan) for coord in coordinates],
+        dtype=np.float64
+    ).reshape(-1, 2)
+
+def _assign_regions(lats, lons):
+    """Index into REGION_BOUNDS of the first region containing each point (-1 for none)"""
+    lat_min, lat_max, lon_min, lon_max = (_REGION_LIMITS[:, j, None] for j in range(4))
+    inside = (lats >= lat_min) & (lats <= lat_max) & (lons >= lon_min) & (lons <= lon_max)
+    return np.where(inside.any(axis=0), inside.argmax(axis=0), -1)
+
+def _region_statistics(regions):
+    """Mean/std of temperature and salinity per region, computed once per data load"""
+    stats = {}
+    for region, data in regions.items():
+        temps = np.asarray(data['temp'], dtype=np.float64)
+        sals = np.asarray(data['sal'], dtype=np.float64)
+        if len(temps) == 0 or len(sals) == 0:
+            continue
+        stats[region] = {
+            'temp_mean': float(temps.mean()),
+            'temp_std': float(temps.std()),
+            'sal_mean': float(sals.mean()),
+            'sal_std': float(sals.std()),
+            'count': len(temps)
+        }
+    return stats
+
+def _padded_array(values, length):
+    """Convert values to a float array of the given length, padding missing entries with NaN"""
+    arr = np.full(length, np.nan)
+    count = min(len(values), length)
+    if count:
+        arr[:count] = np.asarray(values[:count], dtype=np.float64)
+    return arr
+
+def _combine_numeric(sources):
+    """Concatenate numeric_data sections into preallocated arrays (float32 values, float64 coordinates)"""
+    combined = {}
+    
+    for field in ('temperature', 'salinity', 'depths'):
+        total = sum(len(source.get(field, [])) for source in sources)
+        buffer = np.empty(total, dtype=np.float32)
+        offset = 0
+        for source in sources:
+            values = source.get(field, [])
+            count = len(values)
+            try:
+                buffer[offset:offset + count] = np.asarray(values, dtype=np.float32)
+            except (ValueError, TypeError):
+                # Coerce element-wise so only the non-numeric entries become NaN
+                logger.warning(f"Non-numeric {field} values replaced with NaN")
+                buffer[offset:offset + count] = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float32)
+            offset += count
+        combined[field] = buffer
+    
+    total = sum(len(source.get('coordinates', [])) for source in sources)
+    coordinates = np.empty((total, 2), dtype=np.float64)
+    offset = 0
+    for source in sources:
+        values = source.get('coordinates', [])
+        count = len(values)
+        coordinates[offset:offset + count] = _coordinate_array(values)
+        offset += count
+    combined['coordinates'] = coordinates
+    
+    # String IDs (None kept as missing), matching NetCDF float IDs and the Parquet cache
+    combined['float_ids'] = [
+        None if fid is None else str(fid) for source in sources for fid in source.get('float_ids', [])
+    ]
+    return combined
+
+def _decimation_index(length, max_points):
+    """Evenly spaced indices (always keeping the first and last point) capped at max_points"""
+    if length <= max_points:
+        return np.arange(length)
+    return np.unique(np.linspace(0, length - 1, max_points).round().astype(np.int64))
+
+def _profile_values(values, length):
+    """Per-profile values: surface level of 2-D (profile, level) arrays, NaN-padded to length"""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.ndim == 2:
+        arr = arr[:, 0] if arr.shape[1] else np.full(arr.shape[0], np.nan)
+    if len(arr) == length:
+        return arr
+    return _padded_array(arr, length)
+
+def _build_float_frame(trajectories):
+    """Flatten per-float trajectory dicts into one table with a row per profile"""
+    frames = []
+    for float_id, data in trajectories.items():
+        lats = np.asarray(data.get('latitudes', []), dtype=np.float64)
+        n_profiles = len(lats)
+        if n_profiles == 0:
+            continue
+        frames.append(pd.DataFrame({
+            'float_id': float_id,
+            'lat': lats,
+            'lon': _profile_values(data.get('longitudes', []), n_profiles),
+            'depth': _profile_values(data.get('depths', []), n_profiles),
+            'temp': _profile_values(data.get('temperatures', []), n_profiles)
+        }))
+    
+    if not frames:
+        return pd.DataFrame(columns=['float_id', 'lat', 'lon', 'depth', 'temp', 'valid'])
+    
+    float_df = pd.concat(frames, ignore_index=True)
+    float_df['float_id'] = float_df['float_id'].astype('category')
+    # Coordinate validity computed once at ingestion instead of on every rerun
+    float_df['valid'] = float_df['lat'].notna() & float_df['lon'].notna()
+    return float_df
+
+def _viridis_rgb(values):
+    """Map values to (n, 3) uint8 RGB colours on Plotly's Viridis scale"""
+    palette = np.array([
+        [int(color[i:i + 2], 16) for i in (1, 3, 5)] for color in px.colors.sequential.Viridis
+    ], dtype=np.float32)
+    values = np.asarray(values, dtype=np.float32)
+    v_min, v_max = np.nanmin(values), np.nanmax(values)
+    scaled = (values - v_min) / (v_max - v_min) if v_max > v_min else np.zeros_like(values)
+    positions = np.linspace(0, 1, len(palette))
+    rgb = np.column_stack([np.interp(scaled, positions, palette[:, channel]) for channel in range(3)])
+    return rgb.astype(np.uint8)
+
+def _data_summary(processed_data, trajectories, regional_data):
+    """Record counts shown in the status panels, computed once per data load"""
+    numeric_data = processed_data['numeric_data'] if processed_data else {}
+    return {
+        'temp_count': len(numeric_data.get('temperature', [])),
+        'sal_count': len(numeric_data.get('salinity', [])),
+        'coord_count': len(numeric_data.get('coordinates', [])),
+        'active_floats': len(trajectories),
+        'total_profiles': sum(t.get('profile_count', 0) for t in trajectories.values()),
+        'regions_with_data': sum(1 for v in regional_data.values() if len(v.get('temp', [])) > 0)
+    }
+
+def _data_signature(base_path):
+    """Modification times of all input files, used to invalidate cached data"""
+    candidates = [base_path / name for name in DATA_FILES]
+    candidates.extend(sorted((base_path / "data" / "argo").glob("*.nc")))
+    return tuple(
+        (path.name, path.stat().st_mtime_ns) for path in candidates if path.exists()
+    )
+
+def _json_source_signature(base_path):
+    """Names and modification times of the JSON data files present, used to key the Parquet cache"""
+    return [
+        (name, (base_path / name).stat().st_mtime_ns) for name in DATA_FILES if (base_path / name).exists()
+    ]
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_dashboard_data(base_path, data_signature):
+    """Load processed data, trajectories and regional bins once per data version
+
+    Cached as a shared resource (no per-rerun pickling/copying); treat the returned
+    objects as read-only.
+    """
+    loader = GeospatialDashboard(load_data=False)
+    loader.base_path = Path(base_path)
+    loader._load_all_data_uncached()
+    return (loader.processed_data, loader.argo_trajectories, loader.regional_data,
+            loader.regional_stats, loader.float_df, loader.data_summary)
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _cached_trajectory_figure(data_signature, _build_figure):
+    """Build and validate the trajectory figure once per data version
+
+    Cached as a shared go.Figure: st.plotly_chart only serializes a Figure, while a
+    dict would be re-validated on every rerun. Treat the returned objects as read-only.
+    """
+    fig, trajectory_stats = _build_figure()
+    return go.Figure(fig), trajectory_stats
+
+@st.cache_resource(show_spinner=False)
+def _synthetic_depth_pool():
+    """Placeholder depths drawn once per process and sliced per float"""
+    pool = np.random.default_rng(0).uniform(0, 2000, SYNTHETIC_DEPTH_POOL_SIZE).astype(np.float32)
+    pool.flags.writeable = False
+    return pool
+
+def _finite_mask(columns):
+    """True where every row of a (4, n) block is finite"""
+    if NUMEXPR_AVAILABLE:
+        # Fused, blocked kernel: no (4, n) boolean temporary (NaN fails every comparison)
+        a, b, c, d = columns
+        return ne.evaluate('(abs(a) < inf) & (abs(b) < inf) & (abs(c) < inf) & (abs(d) < inf)',
+                           local_dict={'a': a, 'b': b, 'c': c, 'd': d, 'inf': np.float32(np.inf)})
+    return np.isfinite(columns).all(axis=0)
+
+def _synthetic_temperature(depths, rng):
+    """Placeholder profile 28*exp(-depth/1000) + N(0, 1), computed in one float32 buffer"""
+    temps = np.multiply(depths, np.float32(-1.0 / 1000), dtype=np.float32)
+    np.exp(temps, out=temps)
+    temps *= np.float32(28)
+    temps += rng.standard_normal(len(temps), dtype=np.float32)
+    return temps
+
+@st.cache_data(show_spinner=False)
+def _clean_float(float_id, lats, lons, depths, temps):
+    """NaN-free (lons, lats, depths, temps) for one float in the 3D view, or None.
+    
+    Missing depths/temperatures are filled with placeholder values seeded from the
+    float ID, so cached results stay stable across reruns.
+    """
+    lats = np.asarray(lats, dtype=np.float32)
+    lons = np.asarray(lons, dtype=np.float32)
+    depths = np.asarray(depths, dtype=np.float32)
+    temps = np.asarray(temps, dtype=np.float32)
+    
+    if len(lats) == 0 or len(lons) == 0:
+        return None
+    
+    rng = np.random.default_rng(zlib.crc32(str(float_id).encode()))
+    
+    # Generate depths if not available (a read-only view into the shared pool)
+    if len(depths) == 0:
+        pool = _synthetic_depth_pool()
+        if len(lats) < len(pool):
+            start = zlib.crc32(str(float_id).encode()) % (len(pool) - len(lats))
+            depths = pool[start:start + len(lats)]
+        else:
+            depths = rng.uniform(0, 2000, len(lats)).astype(np.float32)
+    
+    # Generate temperatures if not available
+    if len(temps) == 0:
+        temps = _synthetic_temperature(depths, rng)
+    
+    # Filter valid data
+    min_len = min(len(lats), len(lons), len(depths), len(temps))
+    if min_len == 0:
+        return None
+    
+    # One (4, n) block holding lons, lats, depths, temps
+    columns = np.stack([lons[:min_len], lats[:min_len], depths[:min_len], temps[:min_len]])
+    
+    # Remove NaN values in one pass over the stacked columns
+    valid_mask = _finite_mask(columns)
+    
+    n_valid = np.count_nonzero(valid_mask)
+    if n_valid == 0:
+        return None
+    
+    # Single compaction into one contiguous block (skipped when every point is valid);
+    # rows are returned as views
+    if n_valid < min_len:
+        columns = columns.compress(valid_mask, axis=1)
+    valid_lons, valid_lats, valid_depths, valid_temps = columns
+    return valid_lons, valid_lats, valid_depths, valid_temps
+
 class GeospatialDashboard:
     """
     Advanced Geospatial Dashboard for FloatChat
     Handles ARGO float trajectory mapping, depth profiles, and regional analysis
     """
     
-    def __init__(self):
+    def __init__(self, load_data=True):
         """Initialize the Geospatial Dashboard"""
         self.base_path = BASE_PATH
         self.processed_data = None
         self.argo_trajectories = {}
+        self.float_df = _build_float_frame({})
         self.regional_data = {}
+        self.regional_stats = {}
+        self.data_summary = _data_summary(None, {}, {})
+        self.data_signature = None
+        self._rng = np.random.default_rng()  # PCG64 generator for placeholder data
         
         # Create data directories if they don't exist
         (self.base_path / "data").mkdir(exist_ok=True)
         (self.base_path / "data/argo").mkdir(exist_ok=True)
         
         # Load all available data
-        self.load_all_data()
+        if load_data:
+            self.load_all_data()
         
         logger.info("Geospatial Dashboard initialized successfully")
     
-    def load_all_data(self):
-        """Load all available oceanographic data"""
+    def load_all_data(self, force_refresh=False):
+        """Load all available oceanographic data (cached across Streamlit reruns)"""
+        if force_refresh:
+            _load_dashboard_data.clear()
+        
+        signature = _data_signature(self.base_path)
+        self.data_signature = signature
+        (self.processed_data, self.argo_trajectories, self.regional_data,
+         self.regional_stats, self.float_df, self.data_summary) = _load_dashboard_data(str(self.base_path), signature)
+    
+    def _load_all_data_uncached(self):
+        """Load, extract and process all data from disk"""
         try:
             # Load processed JSON data
             self.load_processed_data()
@@ -71,49 +491,145 @@ class GeospatialDashboard:
             
         except Exception as e:
             logger.error(f"Data loading failed: {e}")
+        
+        # Flatten trajectories into one per-profile table for plotting
+        self.float_df = _build_float_frame(self.argo_trajectories)
+        self.data_summary = _data_summary(self.processed_data, self.argo_trajectories, self.regional_data)
     
     def load_processed_data(self):
-        """Load processed oceanographic data from JSON files"""
-        data_files = [
-            "processed_oceanographic_data.json",
-            "argo_extracted_data.json", 
-            "incois_comprehensive_data.json"
-        ]
-        
-        combined_data = {
-            'numeric_data': {
-                'temperature': [],
-                'salinity': [],
-                'coordinates': [],
-                'depths': [],
-                'float_ids': []
-            },
-            'processing_timestamp': datetime.now().isoformat()
-        }
+        """Load processed oceanographic data from the Parquet cache or JSON files"""
+        cached_numeric = self._load_numeric_cache()
+        if cached_numeric is not None:
+            self.processed_data = {
+                'numeric_data': cached_numeric,
+                'processing_timestamp': datetime.fromtimestamp(
+                    self._numeric_cache_path('temperature').stat().st_mtime
+                ).isoformat()
+            }
+            logger.info(f"Combined data loaded from Parquet cache: {len(cached_numeric['temperature'])} temperature records")
+            return
         
-        for file_name in data_files:
+        # Taken before reading, so a source edited mid-read invalidates the cache
+        source_signature = _json_source_signature(self.base_path)
+        numeric_sources = []
+        for file_name in DATA_FILES:
             file_path = self.base_path / file_name
             try:
                 if file_path.exists():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    numeric = self._read_numeric_json(file_path)
                     
                     # Extract numeric data
-                    if 'numeric_data' in data:
-                        numeric = data['numeric_data']
-                        combined_data['numeric_data']['temperature'].extend(numeric.get('temperature', []))
-                        combined_data['numeric_data']['salinity'].extend(numeric.get('salinity', []))
-                        combined_data['numeric_data']['coordinates'].extend(numeric.get('coordinates', []))
-                        combined_data['numeric_data']['depths'].extend(numeric.get('depths', []))
-                        combined_data['numeric_data']['float_ids'].extend(numeric.get('float_ids', []))
+                    if numeric is not None:
+                        numeric_sources.append(numeric)
                     
                     logger.info(f"Loaded data from {file_name}")
                     
             except Exception as e:
                 logger.warning(f"Failed to load {file_name}: {e}")
         
+        combined_data = {
+            'numeric_data': _combine_numeric(numeric_sources),
+            'processing_timestamp': datetime.now().isoformat()
+        }
+        
         self.processed_data = combined_data
         logger.info(f"Combined data loaded: {len(combined_data['numeric_data']['temperature'])} temperature records")
+        
+        self._write_numeric_cache(combined_data['numeric_data'], source_signature)
+    
+    def _read_numeric_json(self, file_path):
+        """Parse the numeric_data section of a JSON file (orjson, or streamed with ijson if huge)"""
+        if IJSON_AVAILABLE and file_path.stat().st_size > STREAMING_JSON_THRESHOLD:
+            numeric = {field: [] for field in ('coordinates', 'float_ids')}
+            numeric.update({field: np.empty(0, dtype=np.float32) for field in ('temperature', 'salinity', 'depths')})
+            # One streaming pass over the file, collecting each numeric_data field as it is reached
+            with open(file_path, 'rb') as f:
+                for field, values in ijson.kvitems(f, 'numeric_data', use_float=True):
+                    if field in ('temperature', 'salinity', 'depths'):
+                        numeric[field] = np.asarray(values, dtype=np.float32)
+                    elif field in ('coordinates', 'float_ids'):
+                        numeric[field] = values
+            return numeric
+        
+        if ORJSON_AVAILABLE:
+            with open(file_path, 'rb') as f:
+                if file_path.stat().st_size > MMAP_JSON_THRESHOLD:
+                    # Parse straight from the page cache instead of copying into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        data = orjson.loads(memoryview(mapped))
+                else:
+                    data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        
+        return data.get('numeric_data') if isinstance(data, dict) else None
+    
+    def _numeric_cache_path(self, field):
+        """Parquet cache file for one combined numeric field"""
+        return self.base_path / "cache" / f"combined_{field}.parquet"
+    
+    def _load_numeric_cache(self):
+        """Memory-map cached numeric columns if they were written from the current JSON sources"""
+        if not PARQUET_AVAILABLE:
+            return None
+        
+        fields = ['temperature', 'salinity', 'coordinates', 'depths', 'float_ids']
+        cache_paths = {field: self._numeric_cache_path(field) for field in fields}
+        if not all(path.exists() for path in cache_paths.values()):
+            return None
+        
+        # The cache is valid only for the same set of source files with the same mtimes
+        source_signature = _json_source_signature(self.base_path)
+        if not source_signature:
+            return None
+        expected = json.dumps(source_signature).encode('utf-8')
+        
+        try:
+            for path in cache_paths.values():
+                metadata = pq.read_schema(path).metadata or {}
+                if metadata.get(NUMERIC_CACHE_SIGNATURE_KEY) != expected:
+                    return None
+            
+            numeric = {}
+            for field, path in cache_paths.items():
+                table = pq.read_table(path, memory_map=True)
+                if field == 'coordinates':
+                    numeric[field] = np.column_stack([
+                        table.column('lat').to_numpy(),
+                        table.column('lon').to_numpy()
+                    ]) if table.num_rows else np.empty((0, 2))
+                elif field == 'float_ids':
+                    numeric[field] = table.column('value').to_pylist()
+                else:
+                    numeric[field] = table.column('value').to_numpy(zero_copy_only=False)
+            return numeric
+        except Exception as e:
+            logger.warning(f"Failed to read Parquet cache: {e}")
+            return None
+    
+    def _write_numeric_cache(self, numeric, source_signature):
+        """Persist combined numeric columns to Parquet for fast reloads, tagged with their sources"""
+        if not PARQUET_AVAILABLE or not source_signature or not any(len(numeric[field]) for field in numeric):
+            return
+        
+        try:
+            (self.base_path / "cache").mkdir(exist_ok=True)
+            coords = _coordinate_array(numeric['coordinates'])
+            tables = {
+                'temperature': pa.table({'value': np.asarray(numeric['temperature'], dtype=np.float32)}),
+                'salinity': pa.table({'value': np.asarray(numeric['salinity'], dtype=np.float32)}),
+                'depths': pa.table({'value': np.asarray(numeric['depths'], dtype=np.float32)}),
+                'coordinates': pa.table({'lat': coords[:, 0], 'lon': coords[:, 1]}),
+                'float_ids': pa.table({'value': pa.array(numeric['float_ids'], type=pa.string())})
+            }
+            metadata = {NUMERIC_CACHE_SIGNATURE_KEY: json.dumps(source_signature)}
+            for field, table in tables.items():
+                pq.write_table(table.replace_schema_metadata(metadata), self._numeric_cache_path(field),
+                               compression='zstd', row_group_size=1_000_000)
+            logger.info("Combined numeric data cached as Parquet")
+        except Exception as e:
+            logger.warning(f"Failed to write Parquet cache: {e}")
     
     def extract_float_trajectories(self):
         """Extract ARGO float trajectories from NetCDF files"""
@@ -128,42 +644,19 @@ class GeospatialDashboard:
                 self.create_trajectories_from_json()
                 return
             
-            for nc_file in nc_files[:15]:  # Process up to 15 files for performance
+            nc_files = nc_files[:15]  # Process up to 15 files for performance
+            
+            # Batched read of all files in one multi-file dataset
+            if XARRAY_AVAILABLE:
                 try:
-                    with nc.Dataset(nc_file, 'r') as ds:
-                        # Extract float identification
-                        if 'PLATFORM_NUMBER' in ds.variables:
-                            platform_num = ds.variables['PLATFORM_NUMBER'][:]
-                            if hasattr(platform_num, 'filled'):
-                                float_id = str(platform_num.filled()[0]).strip()
-                            else:
-                                float_id = str(platform_num[0]).strip()
-                        else:
-                            float_id = nc_file.stem
-                        
-                        # Extract coordinates
-                        lats = self._extract_variable(ds, 'LATITUDE')
-                        lons = self._extract_variable(ds, 'LONGITUDE') 
-                        
-                        if len(lats) > 0 and len(lons) > 0:
-                            # Extract depth and temperature data
-                            depths = self._extract_variable(ds, ['PRES', 'DEPTH'])
-                            temps = self._extract_variable(ds, ['TEMP', 'TEMPERATURE'])
-                            sals = self._extract_variable(ds, ['PSAL', 'SALINITY'])
-                            
-                            trajectories[float_id] = {
-                                'latitudes': lats,
-                                'longitudes': lons,
-                                'depths': depths,
-                                'temperatures': temps,
-                                'salinities': sals,
-                                'file': str(nc_file),
-                                'profile_count': len(lats)
-                            }
-                            
+                    trajectories = self._extract_trajectories_mfdataset(nc_files)
                 except Exception as e:
-                    logger.warning(f"Failed to process {nc_file}: {e}")
-                    continue
+                    logger.warning(f"Batched NetCDF read failed, reading files individually: {e}")
+                    trajectories = {}
+            
+            # Fall back to reading files one at a time
+            if not trajectories:
+                trajectories = self._extract_trajectories_per_file(nc_files)
         
         except Exception as e:
             logger.error(f"NetCDF trajectory extraction failed: {e}")
@@ -172,20 +665,137 @@ class GeospatialDashboard:
         self.argo_trajectories = trajectories
         logger.info(f"Extracted {len(trajectories)} float trajectories")
     
-    def _extract_variable(self, dataset, var_names):
+    def _extract_trajectories_per_file(self, nc_files):
+        """Extract one trajectory per NetCDF file using netCDF4"""
+        trajectories = {}
+        
+        # Files are read one at a time: netCDF4/HDF5 are not thread-safe, and concurrent
+        # Dataset reads crash the process or fail with 'Not a valid ID'
+        for nc_file in nc_files:
+            result = self._extract_file_trajectory(nc_file)
+            if result:
+                float_id, trajectory = result
+                trajectories[float_id] = trajectory
+        
+        return trajectories
+    
+    def _extract_file_trajectory(self, nc_file):
+        """Extract (float_id, trajectory) from a single NetCDF file, or None"""
+        try:
+            with nc.Dataset(nc_file, 'r') as ds:
+                # Extract float identification
+                if 'PLATFORM_NUMBER' in ds.variables:
+                    platform_num = ds.variables['PLATFORM_NUMBER'][:]
+                    if hasattr(platform_num, 'filled'):
+                        float_id = str(platform_num.filled()[0]).strip()
+                    else:
+                        float_id = str(platform_num[0]).strip()
+                else:
+                    float_id = nc_file.stem
+                
+                # Extract coordinates
+                lats = self._extract_variable(ds, 'LATITUDE', dtype=np.float64)
+                lons = self._extract_variable(ds, 'LONGITUDE', dtype=np.float64)
+                
+                if len(lats) > 0 and len(lons) > 0:
+                    # Extract depth and temperature data
+                    depths = self._extract_variable(ds, ['PRES', 'DEPTH'])
+                    temps = self._extract_variable(ds, ['TEMP', 'TEMPERATURE'])
+                    sals = self._extract_variable(ds, ['PSAL', 'SALINITY'])
+                    
+                    return float_id, {
+                        'latitudes': lats,
+                        'longitudes': lons,
+                        'depths': depths,
+                        'temperatures': temps,
+                        'salinities': sals,
+                        'file': str(nc_file),
+                        'profile_count': len(lats)
+                    }
+                    
+        except Exception as e:
+            logger.warning(f"Failed to process {nc_file}: {e}")
+        
+        return None
+    
+    def _extract_trajectories_mfdataset(self, nc_files):
+        """Read all NetCDF files as one dataset and group profiles by platform number"""
+        trajectories = {}
+        
+        with xr.open_mfdataset(
+            nc_files,
+            engine=XARRAY_ENGINE,
+            combine='nested',
+            concat_dim='N_PROF',
+            data_vars='minimal',
+            coords='minimal',
+            compat='override',
+            parallel=DASK_AVAILABLE
+        ) as ds:
+            lats = self._extract_xr_variable(ds, 'LATITUDE')
+            lons = self._extract_xr_variable(ds, 'LONGITUDE')
+            if len(lats) == 0 or len(lons) == 0:
+                return trajectories
+            
+            depths = self._extract_xr_variable(ds, ['PRES', 'DEPTH'])
+            temps = self._extract_xr_variable(ds, ['TEMP', 'TEMPERATURE'])
+            sals = self._extract_xr_variable(ds, ['PSAL', 'SALINITY'])
+            
+            if 'PLATFORM_NUMBER' in ds.variables:
+                platform_ids = [
+                    (p.decode('utf-8', 'ignore') if isinstance(p, bytes) else str(p)).strip()
+                    for p in ds['PLATFORM_NUMBER'].values
+                ]
+            else:
+                platform_ids = ['unknown'] * len(lats)
+        
+        groups = pd.Series(platform_ids).groupby(platform_ids, sort=False).indices
+        for float_id, idx in groups.items():
+            trajectories[float_id] = {
+                'latitudes': lats[idx],
+                'longitudes': lons[idx],
+                'depths': depths[idx] if len(depths) else depths,
+                'temperatures': temps[idx] if len(temps) else temps,
+                'salinities': sals[idx] if len(sals) else sals,
+                'file': str(nc_files[0].parent),
+                'profile_count': len(idx)
+            }
+        
+        return trajectories
+    
+    def _extract_xr_variable(self, dataset, var_names):
+        """Extract variable values from an xarray dataset with multiple possible names"""
+        if isinstance(var_names, str):
+            var_names = [var_names]
+        
+        for var_name in var_names:
+            if var_name in dataset.variables:
+                return dataset[var_name].values
+        
+        return np.array([])
+    
+    def _extract_variable(self, dataset, var_names, dtype=np.float32):
         """Extract variable data from NetCDF dataset with multiple possible names"""
         if isinstance(var_names, str):
             var_names = [var_names]
         
+        target = np.dtype(dtype)
         for var_name in var_names:
             if var_name in dataset.variables:
+                variable = dataset.variables[var_name]
+                try:
+                    variable.set_var_chunk_cache(VAR_CHUNK_CACHE_SIZE, 521, CHUNK_CACHE_PREEMPTION)
+                except RuntimeError:
+                    pass  # NetCDF-3 classic variables have no chunk cache
                 try:
-                    data = dataset.variables[var_name][:]
+                    data = variable[:]
                     if hasattr(data, 'filled'):
-                        return data.filled(np.nan)
+                        # Cast before filling so float32 variables are not upcast to float64
+                        return data.astype(target, copy=False).filled(target.type(np.nan))
                     else:
-                        return np.array(data)
-                except:
+                        return np.asarray(data, dtype=target)
+                except (RuntimeError, OSError, ValueError, TypeError) as e:
+                    logger.debug(f"Could not read {var_name}: {e}")
                     continue
         
         return np.array([])
@@ -201,40 +811,30 @@ class GeospatialDashboard:
         salinities = numeric_data.get('salinity', []) 
         float_ids = numeric_data.get('float_ids', [])
         
-        if not coordinates:
+        if len(coordinates) == 0:
             return
         
-        trajectories = {}
-        
-        # Group data by float ID
-        for i, coord in enumerate(coordinates):
-            if i < len(float_ids) and len(coord) == 2:
-                float_id = float_ids[i] if i < len(float_ids) else f"Float_{i:04d}"
-                
-                if float_id not in trajectories:
-                    trajectories[float_id] = {
-                        'latitudes': [],
-                        'longitudes': [],
-                        'temperatures': [],
-                        'salinities': [],
-                        'depths': [],
-                        'profile_count': 0
-                    }
-                
-                trajectories[float_id]['latitudes'].append(coord[0])
-                trajectories[float_id]['longitudes'].append(coord[1])
-                
-                if i < len(temperatures):
-                    trajectories[float_id]['temperatures'].append(temperatures[i])
-                if i < len(salinities):
-                    trajectories[float_id]['salinities'].append(salinities[i])
-                
-                trajectories[float_id]['profile_count'] += 1
+        # Build one flat table and group by float ID
+        n_points = min(len(coordinates), len(float_ids))
+        coords = _coordinate_array(coordinates[:n_points])
+        df = pd.DataFrame({
+            'float_id': float_ids[:n_points],
+            'lat': coords[:, 0],
+            'lon': coords[:, 1],
+            'temp': _padded_array(temperatures, n_points),
+            'sal': _padded_array(salinities, n_points)
+        })
         
-        # Convert lists to numpy arrays
-        for float_id in trajectories:
-            for key in ['latitudes', 'longitudes', 'temperatures', 'salinities']:
-                trajectories[float_id][key] = np.array(trajectories[float_id][key])
+        trajectories = {}
+        for float_id, group in df.groupby('float_id', sort=False):
+            trajectories[float_id] = {
+                'latitudes': group['lat'].to_numpy(),
+                'longitudes': group['lon'].to_numpy(),
+                'temperatures': group['temp'].to_numpy() if len(temperatures) else np.array([]),
+                'salinities': group['sal'].to_numpy() if len(salinities) else np.array([]),
+                'depths': np.array([]),
+                'profile_count': len(group)
+            }
         
         self.argo_trajectories = trajectories
         logger.info(f"Created {len(trajectories)} trajectories from JSON data")
@@ -249,73 +849,96 @@ class GeospatialDashboard:
         temperatures = numeric_data.get('temperature', [])
         salinities = numeric_data.get('salinity', [])
         
-        regions = {
-            'Bay of Bengal': {'temp': [], 'sal': [], 'coords': []},
-            'Arabian Sea': {'temp': [], 'sal': [], 'coords': []},
-            'Southern Indian Ocean': {'temp': [], 'sal': [], 'coords': []},
-            'Northern Indian Ocean': {'temp': [], 'sal': [], 'coords': []}
-        }
-        
-        for i, coord in enumerate(coordinates):
-            if len(coord) != 2:
-                continue
-                
-            lat, lon = coord
-            
-            # Define regional boundaries
-            region = None
-            if 5 <= lat <= 22 and 80 <= lon <= 100:
-                region = 'Bay of Bengal'
-            elif 8 <= lat <= 25 and 60 <= lon <= 80:
-                region = 'Arabian Sea'
-            elif -10 <= lat <= 5 and 70 <= lon <= 90:
-                region = 'Southern Indian Ocean'
-            elif 22 <= lat <= 30 and 60 <= lon <= 85:
-                region = 'Northern Indian Ocean'
-            
-            if region and i < len(temperatures) and i < len(salinities):
-                regions[region]['coords'].append(coord)
-                regions[region]['temp'].append(temperatures[i])
-                regions[region]['sal'].append(salinities[i])
+        # Only points with matching temperature and salinity records
+        n_points = min(len(coordinates), len(temperatures), len(salinities))
+        coords = _coordinate_array(coordinates[:n_points])
+        temps = np.asarray(temperatures[:n_points], dtype=np.float32)
+        sals = np.asarray(salinities[:n_points], dtype=np.float32)
+        lats = coords[:, 0]
+        lons = coords[:, 1]
+        
+        # Assign every point to its first matching region in one vectorized pass
+        region_idx = _assign_regions(lats, lons)
+        
+        # Partition points by region: stable sort by region index, then split by counts
+        order = np.argsort(region_idx, kind='stable')
+        counts = np.bincount(region_idx + 1, minlength=len(REGION_BOUNDS) + 1)
+        bounds = np.cumsum(counts)
+        
+        regions = {}
+        for k, (region, _, _) in enumerate(REGION_BOUNDS):
+            idx = order[bounds[k]:bounds[k + 1]]
+            regions[region] = {
+                'temp': temps[idx],
+                'sal': sals[idx],
+                'coords': coords[idx]
+            }
         
         self.regional_data = regions
+        self.regional_stats = _region_statistics(regions)
         logger.info(f"Processed regional data for {len(regions)} regions")
     
     def create_trajectory_map(self):
         """Create ARGO float trajectory visualization with enhanced features"""
         st.subheader("🌊 ARGO Float Trajectories - Indian Ocean")
         
-        if not self.argo_trajectories:
+        if not self.argo_trajectories or self.float_df.empty:
             st.warning("No trajectory data available. Generating sample visualization...")
             self._create_sample_trajectory_map()
             return
         
-        fig = go.Figure()
+        if self.data_signature is not None:
+            # Real data: reuse the validated figure object until the input files change
+            fig, trajectory_stats = _cached_trajectory_figure(
+                self.data_signature, self._build_trajectory_figure
+            )
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+        else:
+            # No data signature to cache on: st.plotly_chart validates the dict once
+            fig, trajectory_stats = self._build_trajectory_figure()
+            st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+        
+        # Display trajectory statistics
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Active Floats", trajectory_stats['total_floats'])
+        with col2:
+            st.metric("Total Profiles", trajectory_stats['total_profiles'])
+        with col3:
+            st.metric("Coverage", "Indian Ocean")
+    
+    def _build_trajectory_figure(self):
+        """Build the trajectory map as a plain figure dict and its summary statistics"""
+        traces = []
         colors = px.colors.qualitative.Set1
         
         trajectory_stats = {'total_floats': 0, 'total_profiles': 0, 'coverage_area': 0}
         
-        for i, (float_id, data) in enumerate(self.argo_trajectories.items()):
-            lats = data.get('latitudes', [])
-            lons = data.get('longitudes', [])
-            temps = data.get('temperatures', [])
-            
-            if len(lats) == 0 or len(lons) == 0:
-                continue
-            
+        for i, (float_id, group) in enumerate(self.float_df.groupby('float_id', sort=False, observed=True)):
             # Filter valid coordinates
-            valid_mask = ~(np.isnan(lats) | np.isnan(lons))
-            if not np.any(valid_mask):
+            group = group[group['valid']]
+            if group.empty:
                 continue
-                
-            valid_lats = lats[valid_mask]
-            valid_lons = lons[valid_mask]
-            valid_temps = temps[valid_mask] if len(temps) > 0 else np.full(len(valid_lats), 25.0)
+            
+            valid_lats = group['lat'].to_numpy()
+            valid_lons = group['lon'].to_numpy()
+            valid_temps = group['temp'].to_numpy()
+            if np.isnan(valid_temps).all():
+                valid_temps = np.full(len(valid_lats), 25.0)
+            data = self.argo_trajectories.get(float_id, {})
+            profile_count = data.get('profile_count', len(valid_lats))
+            
+            # Cap points per trajectory to keep the figure payload small
+            keep = _decimation_index(len(valid_lats), MAX_TRAJECTORY_POINTS)
+            valid_lats = valid_lats[keep]
+            valid_lons = valid_lons[keep]
+            valid_temps = valid_temps[keep]
             
             color = colors[i % len(colors)]
             
-            # Add trajectory line
-            fig.add_trace(go.Scattermapbox(
+            # Add trajectory line (raw trace dict; serialized without per-trace validation)
+            traces.append(dict(
+                type="scattermapbox",
                 mode="markers+lines",
                 lon=valid_lons,
                 lat=valid_lats,
@@ -328,7 +951,7 @@ class GeospatialDashboard:
                 },
                 line={'width': 2, 'color': color},
                 name=f"Float {float_id}",
-                hovertemplate=f"<b>Float {float_id}</b><br>" +
+                hovertemplate="<b>%{fullData.name}</b><br>" +
                               "Lat: %{lat:.3f}°N<br>" +
                               "Lon: %{lon:.3f}°E<br>" +
                               "Temp: %{marker.color:.1f}°C<br>" +
@@ -336,27 +959,27 @@ class GeospatialDashboard:
                 showlegend=True
             ))
             
-            # Add start point marker
-            if len(valid_lats) > 0:
-                fig.add_trace(go.Scattermapbox(
-                    mode="markers",
-                    lon=[valid_lons[0]],
-                    lat=[valid_lats[0]],
-                    marker={'size': 15, 'color': 'green', 'symbol': 'star'},
-                    name=f"Start {float_id}",
-                    showlegend=False,
-                    hovertext=f"Deployment: Float {float_id}"
-                ))
+            # Add start point marker (own trace: per-point colours only render on circle markers)
+            traces.append(dict(
+                type="scattermapbox",
+                mode="markers",
+                lon=valid_lons[:1],
+                lat=valid_lats[:1],
+                marker={'size': 15, 'color': 'green', 'symbol': 'star'},
+                name=f"Start {float_id}",
+                showlegend=False,
+                hovertext=f"Deployment: Float {float_id}"
+            ))
             
             # Update statistics
             trajectory_stats['total_floats'] += 1
-            trajectory_stats['total_profiles'] += data.get('profile_count', len(valid_lats))
+            trajectory_stats['total_profiles'] += profile_count
         
         # Configure map layout for Indian Ocean
-        fig.update_layout(
-            mapbox_style="open-street-map",
+        fig = dict(data=traces, layout=dict(
             mapbox=dict(
-                center=go.layout.mapbox.Center(lat=12, lon=78),
+                style="open-street-map",
+                center=dict(lat=12, lon=78),
                 zoom=4
             ),
             height=700,
@@ -373,52 +996,39 @@ class GeospatialDashboard:
                 x=0.01,
                 bgcolor="rgba(255,255,255,0.8)"
             )
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        # Display trajectory statistics
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Active Floats", trajectory_stats['total_floats'])
-        with col2:
-            st.metric("Total Profiles", trajectory_stats['total_profiles'])
-        with col3:
-            st.metric("Coverage", "Indian Ocean")
+        ))
         
-        return fig
+        return fig, trajectory_stats
     
     def _create_sample_trajectory_map(self):
         """Create sample trajectory map when no real data is available"""
-        # Generate realistic sample data for Indian Ocean
+        # Generate realistic sample data for Indian Ocean - all floats in one batch
         n_floats = 5
-        sample_trajectories = {}
+        rng = self._rng
+        n_points = rng.integers(20, 50, n_floats)
+        max_points = n_points.max()
+        
+        base_lats = rng.uniform(8, 20, n_floats)
+        base_lons = rng.uniform(70, 95, n_floats)
+        
+        # Generate realistic trajectories and keep within realistic bounds
+        lats = np.clip(base_lats[:, None] + np.cumsum(rng.normal(0, 0.5, (n_floats, max_points)), axis=1), -5, 25)
+        lons = np.clip(base_lons[:, None] + np.cumsum(rng.normal(0, 0.5, (n_floats, max_points)), axis=1), 60, 100)
+        temps = 28 - 0.5 * lats + rng.normal(0, 1, (n_floats, max_points))
         
+        sample_trajectories = {}
         for i in range(n_floats):
-            float_id = f"290{1000 + i}"
-            
-            # Generate realistic trajectory in Indian Ocean
-            n_points = np.random.randint(20, 50)
-            base_lat = np.random.uniform(8, 20)
-            base_lon = np.random.uniform(70, 95)
-            
-            lats = base_lat + np.cumsum(np.random.normal(0, 0.5, n_points))
-            lons = base_lon + np.cumsum(np.random.normal(0, 0.5, n_points))
-            
-            # Keep within realistic bounds
-            lats = np.clip(lats, -5, 25)
-            lons = np.clip(lons, 60, 100)
-            
-            temps = 28 - 0.5 * lats + np.random.normal(0, 1, n_points)
-            
-            sample_trajectories[float_id] = {
-                'latitudes': lats,
-                'longitudes': lons,
-                'temperatures': temps,
-                'profile_count': n_points
+            count = n_points[i]
+            sample_trajectories[f"290{1000 + i}"] = {
+                'latitudes': lats[i, :count],
+                'longitudes': lons[i, :count],
+                'temperatures': temps[i, :count],
+                'profile_count': int(count)
             }
         
         self.argo_trajectories = sample_trajectories
+        self.float_df = _build_float_frame(sample_trajectories)
+        self.data_signature = None  # Random sample data is never cached
         
         # Now create the map
         self.create_trajectory_map()
@@ -463,9 +1073,12 @@ class GeospatialDashboard:
             
             # Generate sample data if needed
             if len(temps) == 0:
-                temps = 28 * np.exp(-depths/800) + 5 + np.random.normal(0, 0.5, len(depths))
+                temps = 28 * np.exp(-depths/800) + 5 + 0.5 * self._rng.standard_normal(len(depths))
             if len(sals) == 0:
-                sals = 34.5 + 0.5 * np.exp(-depths/1000) + np.random.normal(0, 0.1, len(depths))
+                sals = 34.5 + 0.5 * np.exp(-depths/1000) + 0.1 * self._rng.standard_normal(len(depths))
+            
+            # WebGL traces for large profiles, SVG otherwise
+            scatter = go.Scattergl if np.size(depths) > WEBGL_POINT_THRESHOLD else go.Scatter
             
             # Create profile visualization
             if profile_type == "Both":
@@ -477,7 +1090,7 @@ class GeospatialDashboard:
                 
                 # Temperature profile
                 fig.add_trace(
-                    go.Scatter(x=temps, y=-depths, mode='lines+markers',
+                    scatter(x=temps, y=-depths, mode='lines+markers',
                               name='Temperature', line=dict(color='red', width=2),
                               marker=dict(size=4)),
                     row=1, col=1
@@ -485,7 +1098,7 @@ class GeospatialDashboard:
                 
                 # Salinity profile  
                 fig.add_trace(
-                    go.Scatter(x=sals, y=-depths, mode='lines+markers',
+                    scatter(x=sals, y=-depths, mode='lines+markers',
                               name='Salinity', line=dict(color='blue', width=2),
                               marker=dict(size=4)),
                     row=1, col=2
@@ -493,7 +1106,7 @@ class GeospatialDashboard:
                 
                 # T-S Diagram
                 fig.add_trace(
-                    go.Scatter(x=sals, y=temps, mode='markers+lines',
+                    scatter(x=sals, y=temps, mode='markers+lines',
                               name='T-S Relationship', 
                               marker=dict(color=-depths, colorscale='Viridis', 
                                          showscale=True, colorbar=dict(title="Depth (m)"))),
@@ -515,7 +1128,7 @@ class GeospatialDashboard:
                 param_unit = "°C" if profile_type == "Temperature" else "PSU"
                 color = 'red' if profile_type == "Temperature" else 'blue'
                 
-                fig.add_trace(go.Scatter(
+                fig.add_trace(scatter(
                     x=param_data, y=-depths,
                     mode='lines+markers',
                     name=f'{param_name} Profile',
@@ -560,7 +1173,7 @@ class GeospatialDashboard:
     def _create_sample_depth_profile(self):
         """Create sample depth profile when no real data is available"""
         depths = np.linspace(0, 2000, 100)
-        temps = 28 * np.exp(-depths/800) + 5 + np.random.normal(0, 0.5, 100)
+        temps = 28 * np.exp(-depths/800) + 5 + 0.5 * self._rng.standard_normal(100)
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -598,14 +1211,17 @@ class GeospatialDashboard:
             self._create_sample_regional_analysis()
             return
         
+        # Statistics are computed once at load time and cached with the data
+        region_stats = self.regional_stats or _region_statistics(regions_with_data)
+        
         # Regional comparison visualization
         col1, col2 = st.columns(2)
         
         with col1:
             # Temperature comparison
             region_names = list(regions_with_data.keys())
-            temp_means = [np.mean(regions_with_data[region]['temp']) for region in region_names]
-            temp_stds = [np.std(regions_with_data[region]['temp']) for region in region_names]
+            temp_means = [region_stats[region]['temp_mean'] for region in region_names]
+            temp_stds = [region_stats[region]['temp_std'] for region in region_names]
             
             fig_temp = go.Figure()
             fig_temp.add_trace(go.Bar(
@@ -626,8 +1242,8 @@ class GeospatialDashboard:
         
         with col2:
             # Salinity comparison
-            sal_means = [np.mean(regions_with_data[region]['sal']) for region in region_names]
-            sal_stds = [np.std(regions_with_data[region]['sal']) for region in region_names]
+            sal_means = [region_stats[region]['sal_mean'] for region in region_names]
+            sal_stds = [region_stats[region]['sal_std'] for region in region_names]
             
             fig_sal = go.Figure()
             fig_sal.add_trace(go.Bar(
@@ -649,46 +1265,36 @@ class GeospatialDashboard:
         # Detailed regional map
         st.subheader("Spatial Distribution by Region")
         
-        all_coords = []
-        all_temps = []
-        all_sals = []
-        all_regions = []
+        region_arrays = list(regions_with_data.values())
+        counts = [min(len(d['coords']), len(d['temp']), len(d['sal'])) for d in region_arrays]
         
-        for region, data in regions_with_data.items():
-            coords = data['coords']
-            temps = data['temp']
-            sals = data['sal']
-            
-            for i, coord in enumerate(coords):
-                if i < len(temps) and i < len(sals):
-                    all_coords.append(coord)
-                    all_temps.append(temps[i])
-                    all_sals.append(sals[i])
-                    all_regions.append(region)
-        
-        if all_coords:
+        if sum(counts) > 0:
+            coords = np.concatenate([_coordinate_array(d['coords'][:n]) for d, n in zip(region_arrays, counts)])
             df_regional = pd.DataFrame({
-                'latitude': [coord[0] for coord in all_coords],
-                'longitude': [coord[1] for coord in all_coords],
-                'temperature': all_temps,
-                'salinity': all_sals,
-                'region': all_regions
+                'latitude': coords[:, 0],
+                'longitude': coords[:, 1],
+                'temperature': np.concatenate([np.asarray(d['temp'][:n]) for d, n in zip(region_arrays, counts)]),
+                'salinity': np.concatenate([np.asarray(d['sal'][:n]) for d, n in zip(region_arrays, counts)]),
+                'region': np.repeat(list(regions_with_data.keys()), counts)
             })
             
-            fig_map = px.scatter_mapbox(
-                df_regional,
-                lat='latitude',
-                lon='longitude',
-                color='temperature',
-                size='salinity',
-                hover_data=['region', 'temperature', 'salinity'],
-                color_continuous_scale='Viridis',
-                title="Regional Oceanographic Distribution",
-                mapbox_style="open-street-map",
-                height=600,
-                zoom=4,
-                center=dict(lat=12, lon=78)
-            )
+            if DATASHADER_AVAILABLE and len(df_regional) > DATASHADER_THRESHOLD:
+                fig_map = self._create_rasterized_regional_map(df_regional)
+            else:
+                fig_map = px.scatter_mapbox(
+                    df_regional,
+                    lat='latitude',
+                    lon='longitude',
+                    color='temperature',
+                    size='salinity',
+                    hover_data=['region', 'temperature', 'salinity'],
+                    color_continuous_scale='Viridis',
+                    title="Regional Oceanographic Distribution",
+                    mapbox_style="open-street-map",
+                    height=600,
+                    zoom=4,
+                    center=dict(lat=12, lon=78)
+                )
             
             st.plotly_chart(fig_map, use_container_width=True)
             
@@ -697,21 +1303,60 @@ class GeospatialDashboard:
             
             stats_data = []
             for region in regions_with_data:
-                temp_data = regions_with_data[region]['temp']
-                sal_data = regions_with_data[region]['sal']
+                stats = region_stats[region]
                 
                 stats_data.append({
                     'Region': region,
-                    'Data Points': len(temp_data),
-                    'Avg Temperature (°C)': f"{np.mean(temp_data):.2f}",
-                    'Avg Salinity (PSU)': f"{np.mean(sal_data):.2f}",
-                    'Temp Std Dev': f"{np.std(temp_data):.2f}",
-                    'Sal Std Dev': f"{np.std(sal_data):.2f}"
+                    'Data Points': stats['count'],
+                    'Avg Temperature (°C)': f"{stats['temp_mean']:.2f}",
+                    'Avg Salinity (PSU)': f"{stats['sal_mean']:.2f}",
+                    'Temp Std Dev': f"{stats['temp_std']:.2f}",
+                    'Sal Std Dev': f"{stats['sal_std']:.2f}"
                 })
             
             stats_df = pd.DataFrame(stats_data)
             st.dataframe(stats_df, use_container_width=True)
     
+    def _create_rasterized_regional_map(self, df_regional):
+        """Aggregate mean temperature with Datashader and overlay it as a map image layer"""
+        lon_min, lon_max = df_regional['longitude'].min(), df_regional['longitude'].max()
+        lat_min, lat_max = df_regional['latitude'].min(), df_regional['latitude'].max()
+        
+        # Rasterize in Web Mercator so the image lines up with the basemap
+        x, y = lnglat_to_meters(df_regional['longitude'].to_numpy(), df_regional['latitude'].to_numpy())
+        x_range, y_range = lnglat_to_meters(np.array([lon_min, lon_max]), np.array([lat_min, lat_max]))
+        points = pd.DataFrame({'x': x, 'y': y, 'temperature': df_regional['temperature'].to_numpy()})
+        
+        canvas = dsh.Canvas(plot_width=800, plot_height=600,
+                            x_range=tuple(x_range), y_range=tuple(y_range))
+        agg = canvas.points(points, 'x', 'y', dsh.mean('temperature'))
+        image = tf.shade(agg, cmap=px.colors.sequential.Viridis, how='linear').to_pil()
+        
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        image_uri = "data:image/png;base64," + base64.b64encode(buffer.getvalue()).decode('ascii')
+        
+        fig_map = go.Figure(go.Scattermapbox(lat=[], lon=[]))
+        fig_map.update_layout(
+            title="Regional Oceanographic Distribution (Mean Temperature)",
+            mapbox_style="open-street-map",
+            mapbox=dict(
+                center=dict(lat=12, lon=78),
+                zoom=4,
+                layers=[{
+                    'sourcetype': 'image',
+                    'source': image_uri,
+                    'coordinates': [
+                        [lon_min, lat_max], [lon_max, lat_max],
+                        [lon_max, lat_min], [lon_min, lat_min]
+                    ],
+                    'opacity': 0.8
+                }]
+            ),
+            height=600
+        )
+        return fig_map
+    
     def _create_sample_regional_analysis(self):
         """Create sample regional analysis when no real data is available"""
         regions = ['Bay of Bengal', 'Arabian Sea', 'Southern Indian Ocean', 'Northern Indian Ocean']
@@ -738,84 +1383,95 @@ class GeospatialDashboard:
         """Create advanced 3D ocean data visualization"""
         st.subheader("🌊 3D Ocean Data Visualization")
         
-        if not self.argo_trajectories:
+        if self.float_df.empty:
             st.warning("No 3D data available. Creating sample visualization...")
             self._create_sample_3d_visualization()
             return
         
-        fig = go.Figure()
-        colors = px.colors.qualitative.Set1
-        
-        plot_count = 0
         max_floats = 8  # Limit for performance
         
-        for i, (float_id, data) in enumerate(self.argo_trajectories.items()):
-            if plot_count >= max_floats:
-                break
-                
-            lats = data.get('latitudes', [])
-            lons = data.get('longitudes', [])
-            depths = data.get('depths', [])
-            temps = data.get('temperatures', [])
-            
-            if len(lats) == 0 or len(lons) == 0:
-                continue
-            
-            # Generate depths if not available
-            if len(depths) == 0:
-                depths = np.random.uniform(0, 2000, len(lats))
-            
-            # Generate temperatures if not available
-            if len(temps) == 0:
-                temps = 28 * np.exp(-depths/1000) + np.random.normal(0, 1, len(depths))
-            
-            # Filter valid data
-            min_len = min(len(lats), len(lons), len(depths), len(temps))
-            if min_len == 0:
-                continue
-                
-            valid_lats = lats[:min_len]
-            valid_lons = lons[:min_len]
-            valid_depths = depths[:min_len]
-            valid_temps = temps[:min_len]
-            
-            # Remove NaN values
-            valid_mask = ~(np.isnan(valid_lats) | np.isnan(valid_lons) | 
-                          np.isnan(valid_depths) | np.isnan(valid_temps))
-            
-            if not np.any(valid_mask):
-                continue
-            
-            valid_lats = valid_lats[valid_mask]
-            valid_lons = valid_lons[valid_mask]
-            valid_depths = valid_depths[valid_mask]
-            valid_temps = valid_temps[valid_mask]
-            
-            fig.add_trace(go.Scatter3d(
-                x=valid_lons,
-                y=valid_lats,
-                z=-valid_depths,  # Negative for depth below surface
+        # Whole-table float32 columns; each float is a set of row indices into them
+        float_columns = {
+            name: self.float_df[name].to_numpy(dtype=np.float32)
+            for name in ('lat', 'lon', 'depth', 'temp')
+        }
+        float_rows = self.float_df.groupby('float_id', sort=False, observed=True).indices
+        
+        # Clean floats in the script thread (_clean_float is st.cache_data) until enough have valid points
+        cleaned_floats = []
+        for item in float_rows.items():
+            float_id, columns = self._clean_one_float(item, float_columns)
+            if columns is not None:
+                cleaned_floats.append((float_id, columns))
+                if len(cleaned_floats) >= max_floats:
+                    break
+        
+        plot_count = len(cleaned_floats)
+        
+        # Concatenate all floats into flat columns and draw them as one trace
+        # Dense floats are thinned to an evenly spaced subset of the point budget
+        point_budget = st.sidebar.slider(
+            "3D points per float", min_value=200, max_value=20_000,
+            value=POINT_BUDGET_PER_FLOAT, step=200, key="ocean_3d_point_budget"
+        )
+        keeps = [_decimation_index(len(columns[0]), point_budget) for _, columns in cleaned_floats]
+        counts = [len(keep) for keep in keeps]
+        total = sum(counts)
+        all_lons = np.empty(total, dtype=np.float32)
+        all_lats = np.empty(total, dtype=np.float32)
+        all_depths = np.empty(total, dtype=np.float32)
+        all_temps = np.empty(total, dtype=np.float32)
+        
+        offset = 0
+        for (_, (valid_lons, valid_lats, valid_depths, valid_temps)), keep, n in zip(cleaned_floats, keeps, counts):
+            all_lons[offset:offset + n] = valid_lons[keep]
+            all_lats[offset:offset + n] = valid_lats[keep]
+            all_depths[offset:offset + n] = valid_depths[keep]
+            all_temps[offset:offset + n] = valid_temps[keep]
+            offset += n
+        
+        # Float ID per point for the shared hover template
+        all_ids = np.repeat(np.array([str(float_id) for float_id, _ in cleaned_floats], dtype=object), counts)
+        
+        if PYDECK_AVAILABLE and total > POINT_CLOUD_THRESHOLD:
+            # GPU-instanced deck.gl point cloud keeps every point interactive
+            st.pydeck_chart(
+                self._create_point_cloud_deck(all_lons, all_lats, all_depths, all_temps, all_ids),
+                use_container_width=True
+            )
+            return
+        
+        traces = []
+        if DATASHADER_AVAILABLE and total > DATASHADER_THRESHOLD:
+            # Too many markers for Scatter3d: draw rasterized depth layers instead
+            traces = self._rasterized_3d_layers(all_lons, all_lats, all_depths, all_temps)
+        elif total:
+            traces.append(dict(
+                type='scatter3d',
+                x=all_lons,
+                y=all_lats,
+                z=-all_depths,  # Negative for depth below surface
                 mode='markers',
                 marker=dict(
                     size=6,
-                    color=valid_temps,
+                    color=all_temps,
                     colorscale='Viridis',
-                    showscale=(plot_count == 0),  # Show colorbar only once
-                    colorbar=dict(title="Temperature (°C)", x=1.1) if plot_count == 0 else None,
+                    showscale=True,
+                    colorbar=dict(title="Temperature (°C)", x=1.1),
                     opacity=0.8
                 ),
-                name=f"Float {float_id}",
-                hovertemplate=f'<b>Float {float_id}</b><br>' +
+                customdata=all_ids,
+                name="ARGO Floats",
+                hovertemplate='<b>Float %{customdata}</b><br>' +
                               'Lon: %{x:.3f}°E<br>' +
                               'Lat: %{y:.3f}°N<br>' +
                               'Depth: %{z:.0f}m<br>' +
                               'Temp: %{marker.color:.2f}°C<br>' +
                               '<extra></extra>'
             ))
-            
-            plot_count += 1
         
-        fig.update_layout(
+        # Build the figure once from all traces and the layout
+        fig = go.Figure(data=traces, layout=dict(
             scene=dict(
                 xaxis_title='Longitude (°E)',
                 yaxis_title='Latitude (°N)', 
@@ -824,22 +1480,107 @@ class GeospatialDashboard:
             ),
             height=700,
             title="3D Oceanographic Data - Indian Ocean",
-            showlegend=True
-        )
+            showlegend=False,
+            uirevision='fixed'  # Keep the camera when the figure is rebuilt
+        ))
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
         
         if plot_count == 0:
             st.warning("No valid 3D data found. Creating sample visualization...")
             self._create_sample_3d_visualization()
     
+    def _create_point_cloud_deck(self, lons, lats, depths, temps, float_ids):
+        """deck.gl PointCloudLayer of all points, coloured by temperature"""
+        points = pd.DataFrame({
+            'float_id': float_ids,
+            'lon': lons,
+            'lat': lats,
+            'z': -depths * POINT_CLOUD_DEPTH_SCALE,
+            'depth': depths,
+            'temp': temps,
+            'color': _viridis_rgb(temps).tolist()
+        })
+        
+        layer = pdk.Layer(
+            'PointCloudLayer',
+            points,
+            get_position=['lon', 'lat', 'z'],
+            get_color='color',
+            point_size=2,
+            pickable=True
+        )
+        view_state = pdk.ViewState(latitude=15, longitude=80, zoom=3, pitch=45)
+        
+        return pdk.Deck(
+            layers=[layer],
+            initial_view_state=view_state,
+            map_style=None,
+            tooltip={'html': '<b>Float {float_id}</b><br>Depth: {depth} m<br>Temp: {temp} °C'}
+        )
+    
+    def _clean_one_float(self, item, float_columns):
+        """(float_id, cleaned columns or None) for one float's rows of the float table"""
+        float_id, rows = item
+        depths = float_columns['depth'][rows]
+        temps = float_columns['temp'][rows]
+        
+        # Floats without depth/temperature data have all-NaN columns; pass them as
+        # empty so _clean_float generates placeholder values
+        return float_id, _clean_float(
+            float_id,
+            float_columns['lat'][rows],
+            float_columns['lon'][rows],
+            depths if not np.isnan(depths).all() else [],
+            temps if not np.isnan(temps).all() else []
+        )
+    
+    def _rasterized_3d_layers(self, lons, lats, depths, temps):
+        """Mean-temperature Surface layers, one Datashader lon/lat grid per depth band"""
+        points = pd.DataFrame({'lon': lons, 'lat': lats, 'temp': temps})
+        x_range = (float(lons.min()), float(lons.max()))
+        y_range = (float(lats.min()), float(lats.max()))
+        canvas = dsh.Canvas(plot_width=RASTER_3D_RESOLUTION, plot_height=RASTER_3D_RESOLUTION,
+                            x_range=x_range, y_range=y_range)
+        
+        band_index = np.digitize(depths, RASTER_3D_DEPTH_BANDS[1:-1])
+        t_min, t_max = float(np.nanmin(temps)), float(np.nanmax(temps))
+        
+        layers = []
+        for band in range(len(RASTER_3D_DEPTH_BANDS) - 1):
+            in_band = band_index == band
+            if not in_band.any():
+                continue
+            
+            agg = canvas.points(points[in_band], 'lon', 'lat', dsh.mean('temp'))
+            grid = agg.values
+            band_depth = 0.5 * (RASTER_3D_DEPTH_BANDS[band] + RASTER_3D_DEPTH_BANDS[band + 1])
+            
+            layers.append(go.Surface(
+                x=agg.coords['lon'].values,
+                y=agg.coords['lat'].values,
+                z=np.full(grid.shape, -band_depth, dtype=np.float32),
+                surfacecolor=grid,
+                colorscale='Viridis',
+                cmin=t_min,
+                cmax=t_max,
+                showscale=not layers,  # Show colorbar only once
+                colorbar=dict(title="Temperature (°C)", x=1.1),
+                opacity=0.8,
+                name=f"{RASTER_3D_DEPTH_BANDS[band]:.0f}-{RASTER_3D_DEPTH_BANDS[band + 1]:.0f}m",
+                hovertemplate='Lon: %{x:.2f}°E<br>Lat: %{y:.2f}°N<br>' +
+                              'Depth: %{z:.0f}m<br>Mean Temp: %{surfacecolor:.2f}°C<extra></extra>'
+            ))
+        
+        return layers
+    
     def _create_sample_3d_visualization(self):
         """Create sample 3D visualization when no real data is available"""
         n_points = 200
-        lats = np.random.uniform(5, 25, n_points)
-        lons = np.random.uniform(60, 100, n_points)
-        depths = np.random.uniform(0, 2000, n_points)
-        temps = 30 * np.exp(-depths/1000) + np.random.normal(0, 2, n_points)
+        lats = self._rng.uniform(5, 25, n_points)
+        lons = self._rng.uniform(60, 100, n_points)
+        depths = self._rng.uniform(0, 2000, n_points)
+        temps = 30 * np.exp(-depths/1000) + 2 * self._rng.standard_normal(n_points)
         
         fig = go.Figure(data=go.Scatter3d(
             x=lons, y=lats, z=-depths,
@@ -851,8 +1592,9 @@ class GeospatialDashboard:
                 showscale=True,
                 colorbar=dict(title="Temperature (°C)")
             ),
-            text=[f'Temp: {t:.1f}°C<br>Depth: {d:.0f}m' for t, d in zip(temps, depths)],
-            hovertemplate='<b>Sample Data</b><br>%{text}<br>Lat: %{y:.2f}°N<br>Lon: %{x:.2f}°E<extra></extra>'
+            customdata=np.column_stack([temps, depths]).astype(np.float32),
+            hovertemplate='<b>Sample Data</b><br>Temp: %{customdata[0]:.1f}°C<br>' +
+                          'Depth: %{customdata[1]:.0f}m<br>Lat: %{y:.2f}°N<br>Lon: %{x:.2f}°E<extra></extra>'
         ))
         
         fig.update_layout(
@@ -869,84 +1611,41 @@ class GeospatialDashboard:
         st.plotly_chart(fig, use_container_width=True)
         st.info("This is sample 3D data. Upload NetCDF files for real oceanographic visualization.")
     
-    def render_geospatial_dashboard(self):
-        """Main dashboard rendering function with comprehensive error handling"""
-        st.title("🌊 Advanced Geospatial Oceanographic Dashboard")
-        
-        # System status information
+    @_fragment
+    def _render_status_panel(self):
+        """Data source information expander"""
+        summary = self.data_summary
         with st.expander("📊 Data Source Information", expanded=False):
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.write("**Data Sources:**")
                 if self.processed_data:
-                    temp_count = len(self.processed_data['numeric_data'].get('temperature', []))
-                    sal_count = len(self.processed_data['numeric_data'].get('salinity', []))
-                    coord_count = len(self.processed_data['numeric_data'].get('coordinates', []))
-                    
-                    st.write(f"- Temperature: {temp_count:,} measurements")
-                    st.write(f"- Salinity: {sal_count:,} measurements") 
-                    st.write(f"- Locations: {coord_count:,} coordinates")
+                    st.write(f"- Temperature: {summary['temp_count']:,} measurements")
+                    st.write(f"- Salinity: {summary['sal_count']:,} measurements") 
+                    st.write(f"- Locations: {summary['coord_count']:,} coordinates")
                 else:
                     st.write("- No processed data loaded")
             
             with col2:
                 st.write("**ARGO Trajectories:**")
                 if self.argo_trajectories:
-                    st.write(f"- Active floats: {len(self.argo_trajectories)}")
-                    total_profiles = sum(t.get('profile_count', 0) for t in self.argo_trajectories.values())
-                    st.write(f"- Total profiles: {total_profiles:,}")
+                    st.write(f"- Active floats: {summary['active_floats']}")
+                    st.write(f"- Total profiles: {summary['total_profiles']:,}")
                 else:
                     st.write("- No trajectory data available")
             
             with col3:
                 st.write("**Regional Data:**")
                 if self.regional_data:
-                    regions_with_data = sum(1 for v in self.regional_data.values() if len(v.get('temp', [])) > 0)
-                    st.write(f"- Regions with data: {regions_with_data}")
+                    st.write(f"- Regions with data: {summary['regions_with_data']}")
                     st.write(f"- Coverage: Indian Ocean")
                 else:
                     st.write("- No regional data processed")
-        
-        # Sidebar visualization controls
-        with st.sidebar:
-            st.header("🎛️ Visualization Controls")
-            
-            viz_options = [
-                "🌊 ARGO Float Trajectories",
-                "📊 Depth-Time Profiles", 
-                "🗺️ Regional Comparison",
-                "🌍 3D Ocean Visualization"
-            ]
-            
-            selected_viz = st.radio("Select Visualization:", viz_options)
-            
-            # Data refresh button
-            if st.button("🔄 Refresh Data", use_container_width=True):
-                with st.spinner("Refreshing oceanographic data..."):
-                    self.load_all_data()
-                    st.success("Data refreshed!")
-                    st.rerun()
-        
-        # Main visualization area
-        try:
-            if selected_viz == "🌊 ARGO Float Trajectories":
-                self.create_trajectory_map()
-                
-            elif selected_viz == "📊 Depth-Time Profiles":
-                self.create_depth_profile_analysis()
-                
-            elif selected_viz == "🗺️ Regional Comparison":
-                self.create_regional_comparison()
-                
-            elif selected_viz == "🌍 3D Ocean Visualization":
-                self.create_3d_ocean_visualization()
-                
-        except Exception as e:
-            st.error(f"Visualization error: {e}")
-            st.info("Please try refreshing the data or check file availability")
-        
-        # Footer with data summary and last update
+    
+    @_fragment
+    def _render_system_info(self):
+        """System information footer expander"""
         with st.expander("ℹ️ System Information"):
             col1, col2 = st.columns(2)
             
@@ -956,8 +1655,7 @@ class GeospatialDashboard:
                 st.write(f"- NetCDF Available: {'✅' if NETCDF_AVAILABLE else '❌'}")
                 
                 # Check data file existence
-                data_files = ['processed_oceanographic_data.json', 'argo_extracted_data.json', 'incois_comprehensive_data.json']
-                for file in data_files:
+                for file in DATA_FILES:
                     exists = (self.base_path / file).exists()
                     st.write(f"- {file}: {'✅' if exists else '❌'}")
             
@@ -966,10 +1664,51 @@ class GeospatialDashboard:
                 if self.processed_data:
                     timestamp = self.processed_data.get('processing_timestamp', 'Unknown')
                     st.write(f"- Last Update: {timestamp}")
-                    st.write(f"- Trajectories: {len(self.argo_trajectories)} floats")
+                    st.write(f"- Trajectories: {self.data_summary['active_floats']} floats")
                     st.write(f"- Regional Analysis: {'✅' if self.regional_data else '❌'}")
                 else:
                     st.write("- Status: No data loaded")
+    
+    def render_geospatial_dashboard(self):
+        """Main dashboard rendering function with comprehensive error handling"""
+        st.title("🌊 Advanced Geospatial Oceanographic Dashboard")
+        
+        # System status information (counts precomputed at load time)
+        self._render_status_panel()
+        
+        # Sidebar visualization controls
+        with st.sidebar:
+            st.header("🎛️ Visualization Controls")
+            
+            # Only the selected view's builder runs on each rerun. A radio is used rather
+            # than st.tabs because Streamlit executes the body of every tab on each run.
+            viz_builders = {
+                "🌊 ARGO Float Trajectories": self.create_trajectory_map,
+                "📊 Depth-Time Profiles": self.create_depth_profile_analysis,
+                "🗺️ Regional Comparison": self.create_regional_comparison,
+                "🌍 3D Ocean Visualization": self.create_3d_ocean_visualization
+            }
+            
+            selected_viz = st.radio("Select Visualization:", list(viz_builders),
+                                    key="geospatial_active_view")
+            
+            # Data refresh button
+            if st.button("🔄 Refresh Data", use_container_width=True):
+                with st.spinner("Refreshing oceanographic data..."):
+                    self.load_all_data(force_refresh=True)
+                    _clean_float.clear()
+                    st.success("Data refreshed!")
+                    st.rerun()
+        
+        # Main visualization area
+        try:
+            viz_builders[selected_viz]()
+        except Exception as e:
+            st.error(f"Visualization error: {e}")
+            st.info("Please try refreshing the data or check file availability")
+        
+        # Footer with data summary and last update
+        self._render_system_info()
 
 def main():
     """Main function for standalone dashboard testing"""
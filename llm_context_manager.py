@@ -40,6 +40,50 @@ except ImportError as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# HDF5 chunk cache sizing for full-variable reads (default is ~1 MiB)
+CHUNK_CACHE_SIZE = 256 * 1024 * 1024
+CHUNK_CACHE_NELEMS = 1009
+CHUNK_CACHE_PREEMPTION = 0.75
+VAR_CHUNK_CACHE_SIZE = 64 * 1024 * 1024
+VAR_CHUNK_CACHE_NELEMS = 521
+
+try:
+    nc.set_chunk_cache(CHUNK_CACHE_SIZE, CHUNK_CACHE_NELEMS, CHUNK_CACHE_PREEMPTION)
+except Exception as e:
+    print(f"DEBUG: Could not set NetCDF chunk cache: {e}")
+
+def _read_variable(variable):
+    """Read a whole NetCDF variable with an enlarged per-variable chunk cache"""
+    try:
+        variable.set_var_chunk_cache(VAR_CHUNK_CACHE_SIZE, VAR_CHUNK_CACHE_NELEMS, CHUNK_CACHE_PREEMPTION)
+    except Exception:
+        pass  # Contiguous / classic-format variables have no chunk cache
+    return variable[:]
+
+def _values_in_range(data, low: float, high: float) -> np.ndarray:
+    """Flattened values of a NetCDF variable within [low, high] (NaN and fill values drop out)"""
+    values = np.asarray(data, dtype=np.float64).ravel()
+    # NaN compares False against both bounds, so the range mask also removes it
+    return values[(values >= low) & (values <= high)]
+
+# Characters that mark a query as written in each supported non-English language
+LANGUAGE_CHARACTERS = (
+    ('hi', frozenset('तापमान समुद्र लवणता गहराई')),
+    ('ta', frozenset('வெப்பநிலை கடல் உப்பு')),
+    ('te', frozenset('ఉష్ణోగ్రత సముద్రం లవణత')),
+    ('bn', frozenset('তাপমাত্রা সমুদ্র লবণাক্ততা'))
+)
+
+# Query keywords by intent, matched as substrings in one scan. Each alternative sits in a
+# lookahead so overlapping keywords of different intents are all found.
+INTENT_KEYWORD_PATTERN = re.compile(
+    r'(?=(?:(?P<temperature>temperature|temp|thermal)'
+    r'|(?P<salinity>salinity|salt|psu)'
+    r'|(?P<depth>depth|pressure|deep)'
+    r'|(?P<statistics>average|mean|correlation|compare|analyze|statistics)'
+    r'|(?P<spatial>location|region|bengal|arabian|coordinates|map)))'
+)
+
 class LLMContextManager:
     """Advanced context manager for LLM interactions with real oceanographic data"""
     
@@ -62,6 +106,9 @@ class LLMContextManager:
         self.netcdf_metadata = {}
         self.processed_summaries = {}
         
+        # NetCDF per-file parameter summaries pivoted into arrays per parameter
+        self._param_table: Dict[str, Dict[str, Any]] = {}
+        
         # Context optimization strategies
         self.optimization_strategies = {
             'temperature_focused': self._optimize_for_temperature,
@@ -72,6 +119,9 @@ class LLMContextManager:
             'research_focused': self._optimize_for_research
         }
         
+        # Strategy results per (strategy, parameters, language); cleared whenever data is reloaded
+        self._strategy_cache: Dict[Tuple[str, Tuple[str, ...], str], Dict[str, Any]] = {}
+        
         # Load real data for context
         self.load_real_oceanographic_context()
         
@@ -123,90 +173,29 @@ class LLMContextManager:
                 'temporal_coverage': {}
             }
             
-            # Process sample NetCDF files for context
+            # Process sample NetCDF files for context one at a time: netCDF4/HDF5 are not
+            # thread-safe, so concurrent Dataset reads can corrupt state or crash the process
+            coordinate_ranges = netcdf_context['coordinate_ranges']
             for nc_file in nc_files[:5]:  # Sample first 5 files for context
-                try:
-                    print(f"DEBUG: Processing NetCDF context from {nc_file}")
-                    ds = nc.Dataset(nc_file, 'r')
-                    
-                    # Collect variable information
-                    variables = list(ds.variables.keys())
-                    netcdf_context['variables_summary'].update(variables)
-                    
-                    # Extract coordinate ranges
-                    for lat_var in ['LATITUDE', 'latitude', 'lat']:
-                        if lat_var in ds.variables:
-                            lat_data = ds.variables[lat_var][:]
-                            lat_values = np.array(lat_data).flatten()
-                            valid_lats = [lat for lat in lat_values if not np.isnan(lat) and -90 <= lat <= 90]
-                            
-                            if valid_lats:
-                                if 'latitude' not in netcdf_context['coordinate_ranges']:
-                                    netcdf_context['coordinate_ranges']['latitude'] = {'min': float(min(valid_lats)), 'max': float(max(valid_lats))}
-                                else:
-                                    netcdf_context['coordinate_ranges']['latitude']['min'] = min(netcdf_context['coordinate_ranges']['latitude']['min'], float(min(valid_lats)))
-                                    netcdf_context['coordinate_ranges']['latitude']['max'] = max(netcdf_context['coordinate_ranges']['latitude']['max'], float(max(valid_lats)))
-                            break
-                    
-                    for lon_var in ['LONGITUDE', 'longitude', 'lon']:
-                        if lon_var in ds.variables:
-                            lon_data = ds.variables[lon_var][:]
-                            lon_values = np.array(lon_data).flatten()
-                            valid_lons = [lon for lon in lon_values if not np.isnan(lon) and -180 <= lon <= 180]
-                            
-                            if valid_lons:
-                                if 'longitude' not in netcdf_context['coordinate_ranges']:
-                                    netcdf_context['coordinate_ranges']['longitude'] = {'min': float(min(valid_lons)), 'max': float(max(valid_lons))}
-                                else:
-                                    netcdf_context['coordinate_ranges']['longitude']['min'] = min(netcdf_context['coordinate_ranges']['longitude']['min'], float(min(valid_lons)))
-                                    netcdf_context['coordinate_ranges']['longitude']['max'] = max(netcdf_context['coordinate_ranges']['longitude']['max'], float(max(valid_lons)))
-                            break
-                    
-                    # Extract data ranges for key parameters
-                    file_summary = {'filename': str(nc_file), 'parameters': {}}
-                    
-                    for temp_var in ['TEMP', 'temperature']:
-                        if temp_var in ds.variables:
-                            temp_data = ds.variables[temp_var][:]
-                            temp_values = np.array(temp_data).flatten()
-                            valid_temps = [t for t in temp_values if not np.isnan(t) and -5 <= t <= 40]
-                            
-                            if valid_temps:
-                                file_summary['parameters']['temperature'] = {
-                                    'count': len(valid_temps),
-                                    'min': float(min(valid_temps)),
-                                    'max': float(max(valid_temps)),
-                                    'mean': float(np.mean(valid_temps))
-                                }
-                            break
-                    
-                    for sal_var in ['PSAL', 'salinity']:
-                        if sal_var in ds.variables:
-                            sal_data = ds.variables[sal_var][:]
-                            sal_values = np.array(sal_data).flatten()
-                            valid_sals = [s for s in sal_values if not np.isnan(s) and 25 <= s <= 40]
-                            
-                            if valid_sals:
-                                file_summary['parameters']['salinity'] = {
-                                    'count': len(valid_sals),
-                                    'min': float(min(valid_sals)),
-                                    'max': float(max(valid_sals)),
-                                    'mean': float(np.mean(valid_sals))
-                                }
-                            break
-                    
-                    if file_summary['parameters']:
-                        netcdf_context['data_summaries'].append(file_summary)
-                    
-                    ds.close()
-                    print(f"DEBUG: NetCDF context extracted from {nc_file}")
-                    
-                except Exception as e:
-                    print(f"DEBUG: Failed to process {nc_file} for context: {e}")
+                file_context = self._extract_netcdf_file_context(nc_file)
+                if not file_context:
                     continue
+                
+                netcdf_context['variables_summary'].update(file_context['variables'])
+                
+                for coord, (coord_min, coord_max) in file_context['coordinate_ranges'].items():
+                    if coord not in coordinate_ranges:
+                        coordinate_ranges[coord] = {'min': coord_min, 'max': coord_max}
+                    else:
+                        coordinate_ranges[coord]['min'] = min(coordinate_ranges[coord]['min'], coord_min)
+                        coordinate_ranges[coord]['max'] = max(coordinate_ranges[coord]['max'], coord_max)
+                
+                if file_context['file_summary']['parameters']:
+                    netcdf_context['data_summaries'].append(file_context['file_summary'])
             
             netcdf_context['variables_summary'] = list(netcdf_context['variables_summary'])
             self.netcdf_metadata = netcdf_context
+            self._param_table = self._build_param_table(netcdf_context['data_summaries'])
             
             # Load processed JSON data for context
             json_files = [
@@ -250,6 +239,89 @@ class LLMContextManager:
             
         except Exception as e:
             print(f"DEBUG: Failed to load oceanographic context: {e}")
+        
+        # Cached strategy contexts were built from the previous data
+        self._strategy_cache.clear()
+    
+    def _extract_netcdf_file_context(self, nc_file) -> Optional[Dict[str, Any]]:
+        """Variables, coordinate ranges and parameter summary of one NetCDF file, or None on failure"""
+        try:
+            print(f"DEBUG: Processing NetCDF context from {nc_file}")
+            with nc.Dataset(nc_file, 'r') as ds:
+                # Collect variable information
+                variables = list(ds.variables.keys())
+                
+                # Extract coordinate ranges as (min, max)
+                coordinate_ranges = {}
+                for coord, candidates, low, high in (
+                    ('latitude', ['LATITUDE', 'latitude', 'lat'], -90, 90),
+                    ('longitude', ['LONGITUDE', 'longitude', 'lon'], -180, 180)
+                ):
+                    for coord_var in candidates:
+                        if coord_var in ds.variables:
+                            valid = _values_in_range(_read_variable(ds.variables[coord_var]), low, high)
+                            if valid.size:
+                                coordinate_ranges[coord] = (float(valid.min()), float(valid.max()))
+                            break
+                
+                # Extract data ranges for key parameters
+                file_summary = {'filename': str(nc_file), 'parameters': {}}
+                
+                for param, candidates, low, high in (
+                    ('temperature', ['TEMP', 'temperature'], -5, 40),
+                    ('salinity', ['PSAL', 'salinity'], 25, 40)
+                ):
+                    for param_var in candidates:
+                        if param_var in ds.variables:
+                            valid = _values_in_range(_read_variable(ds.variables[param_var]), low, high)
+                            if valid.size:
+                                file_summary['parameters'][param] = {
+                                    'count': int(valid.size),
+                                    'min': float(valid.min()),
+                                    'max': float(valid.max()),
+                                    'mean': float(valid.mean())
+                                }
+                            break
+            
+            print(f"DEBUG: NetCDF context extracted from {nc_file}")
+            return {
+                'variables': variables,
+                'coordinate_ranges': coordinate_ranges,
+                'file_summary': file_summary
+            }
+        
+        except Exception as e:
+            print(f"DEBUG: Failed to process {nc_file} for context: {e}")
+            return None
+    
+    def _build_param_table(self, data_summaries: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Pivot per-file parameter summaries into per-parameter arrays
+        
+        Parameters keep the order in which they first appear across files.
+        """
+        columns = {}
+        for file_summary in data_summaries:
+            for param, data in file_summary['parameters'].items():
+                column = columns.setdefault(param, {'mins': [], 'maxs': [], 'means': [], 'counts': [], 'sources': []})
+                column['mins'].append(data['min'])
+                column['maxs'].append(data['max'])
+                column['means'].append(data['mean'])
+                column['counts'].append(data['count'])
+                column['sources'].append(file_summary['filename'])
+        
+        param_table = {}
+        for param, column in columns.items():
+            table = {
+                'mins': np.asarray(column['mins'], dtype=np.float64),
+                'maxs': np.asarray(column['maxs'], dtype=np.float64),
+                'means': np.asarray(column['means'], dtype=np.float64),
+                'counts': np.asarray(column['counts'], dtype=np.int64),
+                'sources': column['sources']
+            }
+            # Mean over every file's (min, max, mean) triple, as reported in the context summaries
+            table['triple_mean'] = (table['mins'].sum() + table['maxs'].sum() + table['means'].sum()) / (3 * table['mins'].size)
+            param_table[param] = table
+        return param_table
     
     def optimize_context_for_query(self, query: str, user_id: str = "default", 
                                  conversation_history: Optional[List[Dict]] = None) -> Dict[str, Any]:
@@ -286,7 +358,14 @@ class LLMContextManager:
         # Apply optimization strategy
         if optimization_strategy in self.optimization_strategies:
             try:
-                optimized_data = self.optimization_strategies[optimization_strategy](query_analysis)
+                # Strategies only read the loaded data plus the query's parameters and language
+                cache_key = (optimization_strategy, tuple(sorted(query_analysis['parameters'])),
+                             query_analysis['language'])
+                optimized_data = self._strategy_cache.get(cache_key)
+                if optimized_data is None:
+                    optimized_data = self.optimization_strategies[optimization_strategy](query_analysis)
+                    self._strategy_cache[cache_key] = optimized_data
+                # Shared with later queries: real_data_context is only read, never mutated
                 base_context['real_data_context'] = optimized_data
                 print(f"DEBUG: Applied {optimization_strategy} optimization")
             except Exception as e:
@@ -303,7 +382,7 @@ class LLMContextManager:
         base_context['system_context'] = self._build_system_context(query_analysis)
         
         # Store context for user
-        context_id = hashlib.md5(f"{query}_{user_id}_{time.time()}".encode()).hexdigest()[:12]
+        context_id = hashlib.blake2b(f"{query}_{user_id}_{time.time()}".encode(), digest_size=6).hexdigest()
         self.conversation_contexts[user_id][context_id] = base_context
         
         processing_time = time.time() - start_time
@@ -330,35 +409,34 @@ class LLMContextManager:
         }
         
         # Language detection
-        if any(char in query for char in 'तापमान समुद्र लवणता गहराई'):
-            analysis['language'] = 'hi'
-        elif any(char in query for char in 'வெப்பநிலை கடல் உப்பு'):
-            analysis['language'] = 'ta'
-        elif any(char in query for char in 'ఉష్ణోగ్రత సముద్రం లవణత'):
-            analysis['language'] = 'te'
-        elif any(char in query for char in 'তাপমাত্রা সমুদ্র লবণাক্ততা'):
-            analysis['language'] = 'bn'
+        for language, characters in LANGUAGE_CHARACTERS:
+            if not characters.isdisjoint(query):
+                analysis['language'] = language
+                break
+        
+        # Keyword groups present in the query, from a single scan
+        hits = {match.lastgroup for match in INTENT_KEYWORD_PATTERN.finditer(query_lower)}
         
         # Intent type detection
-        if any(word in query_lower for word in ['temperature', 'temp', 'thermal']):
+        if 'temperature' in hits:
             analysis['intent_types'].append('temperature_analysis')
             analysis['parameters'].append('temperature')
         
-        if any(word in query_lower for word in ['salinity', 'salt', 'psu']):
+        if 'salinity' in hits:
             analysis['intent_types'].append('salinity_analysis')
             analysis['parameters'].append('salinity')
         
-        if any(word in query_lower for word in ['depth', 'pressure', 'deep']):
+        if 'depth' in hits:
             analysis['intent_types'].append('depth_analysis')
             analysis['parameters'].append('pressure')
         
         # Statistical requirements
-        if any(word in query_lower for word in ['average', 'mean', 'correlation', 'compare', 'analyze', 'statistics']):
+        if 'statistics' in hits:
             analysis['statistical_requirements'].extend(['descriptive_stats', 'comparative_analysis'])
             analysis['intent_types'].append('statistical_analysis')
         
         # Spatial requirements  
-        if any(word in query_lower for word in ['location', 'region', 'bengal', 'arabian', 'coordinates', 'map']):
+        if 'spatial' in hits:
             analysis['spatial_requirements'].append('regional_analysis')
             analysis['intent_types'].append('spatial_analysis')
         
@@ -409,15 +487,11 @@ class LLMContextManager:
             'statistical_summary': {}
         }
         
-        # Extract temperature data from NetCDF context
-        temp_measurements = []
-        coordinate_data = []
-        
-        for file_summary in self.netcdf_metadata.get('data_summaries', []):
-            if 'temperature' in file_summary['parameters']:
-                temp_params = file_summary['parameters']['temperature']
-                temp_measurements.extend([temp_params['min'], temp_params['max'], temp_params['mean']])
-                context_data['data_sources'].append(file_summary['filename'])
+        # Extract temperature data from NetCDF context (min, max and mean of every file)
+        temp_table = self._param_table.get('temperature')
+        measurement_count = 3 * len(temp_table['sources']) if temp_table else 0
+        if temp_table:
+            context_data['data_sources'].extend(temp_table['sources'])
         
         # Add processed data temperature context
         for dataset_key, summary in self.processed_summaries.items():
@@ -425,12 +499,12 @@ class LLMContextManager:
                 temp_data = summary['temperature']
                 context_data['real_measurements'][dataset_key] = temp_data
         
-        if temp_measurements:
+        if measurement_count:
             context_data['statistical_summary'] = {
-                'measurement_count': len(temp_measurements),
-                'temperature_range': [float(min(temp_measurements)), float(max(temp_measurements))],
-                'mean_temperature': float(np.mean(temp_measurements)),
-                'data_quality': 'high' if len(temp_measurements) > 50 else 'moderate'
+                'measurement_count': measurement_count,
+                'temperature_range': [float(temp_table['mins'].min()), float(temp_table['maxs'].max())],
+                'mean_temperature': float(temp_table['triple_mean']),
+                'data_quality': 'high' if measurement_count > 50 else 'moderate'
             }
         
         # Regional context if coordinates available
@@ -442,7 +516,7 @@ class LLMContextManager:
                 'primary_regions': self._identify_regions(coord_ranges)
             }
         
-        print(f"DEBUG: Temperature context optimized - {len(temp_measurements)} measurements, {len(context_data['data_sources'])} sources")
+        print(f"DEBUG: Temperature context optimized - {measurement_count} measurements, {len(context_data['data_sources'])} sources")
         
         return context_data
     
@@ -457,14 +531,11 @@ class LLMContextManager:
             'statistical_summary': {}
         }
         
-        # Extract salinity data from NetCDF context
-        sal_measurements = []
-        
-        for file_summary in self.netcdf_metadata.get('data_summaries', []):
-            if 'salinity' in file_summary['parameters']:
-                sal_params = file_summary['parameters']['salinity']
-                sal_measurements.extend([sal_params['min'], sal_params['max'], sal_params['mean']])
-                context_data['data_sources'].append(file_summary['filename'])
+        # Extract salinity data from NetCDF context (min, max and mean of every file)
+        sal_table = self._param_table.get('salinity')
+        measurement_count = 3 * len(sal_table['sources']) if sal_table else 0
+        if sal_table:
+            context_data['data_sources'].extend(sal_table['sources'])
         
         # Add processed data salinity context
         for dataset_key, summary in self.processed_summaries.items():
@@ -472,15 +543,15 @@ class LLMContextManager:
                 sal_data = summary['salinity']
                 context_data['real_measurements'][dataset_key] = sal_data
         
-        if sal_measurements:
+        if measurement_count:
             context_data['statistical_summary'] = {
-                'measurement_count': len(sal_measurements),
-                'salinity_range_psu': [float(min(sal_measurements)), float(max(sal_measurements))],
-                'mean_salinity_psu': float(np.mean(sal_measurements)),
-                'data_quality': 'high' if len(sal_measurements) > 30 else 'moderate'
+                'measurement_count': measurement_count,
+                'salinity_range_psu': [float(sal_table['mins'].min()), float(sal_table['maxs'].max())],
+                'mean_salinity_psu': float(sal_table['triple_mean']),
+                'data_quality': 'high' if measurement_count > 30 else 'moderate'
             }
         
-        print(f"DEBUG: Salinity context optimized - {len(sal_measurements)} measurements")
+        print(f"DEBUG: Salinity context optimized - {measurement_count} measurements")
         
         return context_data
     
@@ -533,11 +604,8 @@ class LLMContextManager:
         parameter_counts = {}
         
         # From NetCDF data
-        for file_summary in self.netcdf_metadata.get('data_summaries', []):
-            for param, data in file_summary['parameters'].items():
-                if param not in parameter_counts:
-                    parameter_counts[param] = 0
-                parameter_counts[param] += data['count']
+        for param, table in self._param_table.items():
+            parameter_counts[param] = int(table['counts'].sum())
         
         # From processed data
         for dataset_key, summary in self.processed_summaries.items():
@@ -610,11 +678,14 @@ class LLMContextManager:
         for dataset_key, summary in self.processed_summaries.items():
             research_context['all_available_data'][dataset_key] = summary
         
-        # Research capabilities assessment
-        total_measurements = sum([
-            sum([param_data['count'] for param_data in file_data.values() if isinstance(param_data, dict) and 'count' in param_data])
-            for file_data in research_context['all_available_data'].values()
-        ])
+        # Research capabilities assessment: NetCDF counts from the parameter table, plus processed datasets
+        total_measurements = sum(int(table['counts'].sum()) for table in self._param_table.values())
+        total_measurements += sum(
+            param_data['count']
+            for summary in self.processed_summaries.values()
+            for param_data in summary.values()
+            if isinstance(param_data, dict) and 'count' in param_data
+        )
         
         capabilities = ['descriptive_analysis']
         if total_measurements > 100: